@@ -7,14 +7,22 @@ matching subfolders of a destination directory.
 """
 import sys
 import os
+import atexit
+import multiprocessing
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, Iterator, List, Optional, Tuple
 
 from PySide6.QtCore import Qt, QThread, Signal
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QPushButton, QFileDialog, QCheckBox, QTextEdit, QProgressBar, QFrame,
-    QMessageBox
+    QPushButton, QFileDialog, QCheckBox, QRadioButton, QPlainTextEdit,
+    QProgressBar, QFrame, QMessageBox
 )
 from PySide6.QtGui import QFont
 
@@ -69,9 +77,11 @@ class Theme:
 
 class Colors:
     _theme = Theme.LIGHT
+    is_dark = False
 
     @classmethod
     def set_theme(cls, is_dark: bool):
+        cls.is_dark = is_dark
         cls._theme = Theme.get_theme(is_dark)
         cls._update_colors()
 
@@ -108,6 +118,118 @@ class Colors:
     TEXT_MUTED = Theme.LIGHT["TEXT_MUTED"]
 
 
+# ----------------------- Stylesheets -----------------------
+def _build_stylesheets(t: dict) -> dict:
+    """Render every stylesheet for one theme palette."""
+    is_dark = t is Theme.DARK
+    disabled_bg = "#64748B" if is_dark else "#D1D5DB"
+    disabled_text = "#94A3B8" if is_dark else "#9CA3AF"
+    button_colors = {
+        "primary": (t["PRIMARY"], "#FFFFFF"),
+        "success": (t["SUCCESS"], "#FFFFFF"),
+        "danger": (t["DANGER"], "#FFFFFF"),
+        "secondary": (t["BORDER"], t["TEXT"]),
+    }
+    buttons = {
+        variant: f"""
+            QPushButton {{
+                background-color: {bg_color};
+                color: {text_color};
+                border: none;
+                border-radius: 4px;
+                padding: 0px 8px;
+                font-size: 11px;
+                font-weight: 600;
+                height: 26px;
+            }}
+            QPushButton:hover {{
+                opacity: 0.9;
+                background-color: {bg_color};
+            }}
+            QPushButton:pressed {{
+                opacity: 0.8;
+            }}
+            QPushButton:disabled {{
+                background-color: {disabled_bg};
+                color: {disabled_text};
+            }}
+        """
+        for variant, (bg_color, text_color) in button_colors.items()
+    }
+    return {
+        "window": f"""
+        QWidget {{
+            background-color: {t["BACKGROUND"]};
+            color: {t["TEXT"]};
+            font-family: 'Segoe UI';
+        }}
+        QLineEdit {{
+            background-color: {t["INPUT_BG"]};
+            color: {t["TEXT"]};
+            border: 1px solid {t["BORDER"]};
+            border-radius: 4px;
+            padding: 4px 6px;
+            font-size: 11px;
+        }}
+        QLineEdit:focus {{
+            border-color: {t["BORDER_FOCUS"]};
+        }}
+        QPlainTextEdit {{
+            background-color: {t["INPUT_BG"]};
+            color: {t["TEXT"]};
+            border: 1px solid {t["BORDER"]};
+            border-radius: 4px;
+            padding: 4px;
+            font-size: 10px;
+        }}
+        QCheckBox, QRadioButton {{
+            color: {t["TEXT"]};
+            font-size: 11px;
+            spacing: 6px;
+        }}
+        QProgressBar {{
+            background-color: {t["INPUT_BG"]};
+            border: 1px solid {t["BORDER"]};
+            border-radius: 4px;
+            text-align: center;
+            height: 18px;
+            font-size: 10px;
+            color: {t["TEXT"]};
+        }}
+        QProgressBar::chunk {{
+            background-color: {t["PRIMARY"]};
+            border-radius: 3px;
+        }}
+        QLabel {{
+            color: {t["TEXT"]};
+        }}
+        """,
+        "card": f"""
+        QFrame {{
+            background-color: {t["CARD"]};
+            border: 1px solid {t["BORDER"]};
+            border-radius: 6px;
+            padding: 6px;
+        }}
+        """,
+        "card_title": f"""
+        font-size: 12px;
+        font-weight: 600;
+        color: {t["TEXT"]};
+        padding-bottom: 4px;
+        border-bottom: 1px solid {t["BORDER"]};
+        """,
+        "buttons": buttons,
+    }
+
+
+# Built once at import; theme switches only swap in the cached strings
+STYLESHEETS = {
+    False: _build_stylesheets(Theme.LIGHT),
+    True: _build_stylesheets(Theme.DARK),
+}
+
+
 # ----------------------- UI Components -----------------------
 class ModernCard(QFrame):
     def __init__(self, title=None, parent=None):
@@ -129,22 +251,10 @@ class ModernCard(QFrame):
         layout.addLayout(self.content_layout)
 
     def update_style(self):
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.CARD};
-                border: 1px solid {Colors.BORDER};
-                border-radius: 6px;
-                padding: 6px;
-            }}
-        """)
+        sheets = STYLESHEETS[Colors.is_dark]
+        self.setStyleSheet(sheets["card"])
         if self.title_label:
-            self.title_label.setStyleSheet(f"""
-                font-size: 12px;
-                font-weight: 600;
-                color: {Colors.TEXT};
-                padding-bottom: 4px;
-                border-bottom: 1px solid {Colors.BORDER};
-            """)
+            self.title_label.setStyleSheet(sheets["card_title"])
 
     def add_widget(self, widget):
         self.content_layout.addWidget(widget)
@@ -161,125 +271,537 @@ class ModernButton(QPushButton):
         self.setCursor(Qt.PointingHandCursor)
 
     def update_style(self):
-        colors = {
-            "primary": (Colors.PRIMARY, "#FFFFFF"),
-            "success": (Colors.SUCCESS, "#FFFFFF"),
-            "danger": (Colors.DANGER, "#FFFFFF"),
-            "secondary": (Colors.BORDER, Colors.TEXT),
-        }
-        bg_color, text_color = colors.get(self._variant, colors["primary"])
-        disabled_bg = "#64748B" if Colors._theme == Theme.DARK else "#D1D5DB"
-        disabled_text = "#94A3B8" if Colors._theme == Theme.DARK else "#9CA3AF"
-
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {bg_color};
-                color: {text_color};
-                border: none;
-                border-radius: 4px;
-                padding: 0px 8px;
-                font-size: 11px;
-                font-weight: 600;
-                height: 26px;
-            }}
-            QPushButton:hover {{
-                opacity: 0.9;
-                background-color: {bg_color};
-            }}
-            QPushButton:pressed {{
-                opacity: 0.8;
-            }}
-            QPushButton:disabled {{
-                background-color: {disabled_bg};
-                color: {disabled_text};
-            }}
-        """)
+        buttons = STYLESHEETS[Colors.is_dark]["buttons"]
+        self.setStyleSheet(buttons.get(self._variant, buttons["primary"]))
+
+
+# ----------------------- Scanning -----------------------
+def _walk(root: str, suffixes: Tuple[str, ...],
+          stop: Optional[Callable[[], bool]] = None) -> Iterator[str]:
+    """Yield paths of files under root whose name ends with one of suffixes.
+
+    Names are tested before anything is stat'ed, so non-matching files cost
+    nothing beyond the directory listing. suffixes must be lowercase and
+    include the dot, e.g. (".docx", ".doc"). The walk ends early once
+    stop() returns True; it is checked once per folder.
+    """
+    if stop is not None and stop():
+        return
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return  # unreadable folder
+    with it:
+        for entry in it:
+            name = entry.name
+            if name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk(entry.path, suffixes, stop)
+            elif name.lower().endswith(suffixes) and entry.is_file():
+                yield entry.path
+
+
+class Job:
+    """One document to convert, held as plain strings.
+
+    src, stem and rel are filled in by the scan; dest_dir, pdf_name and
+    dest_file once the worker has picked the output name.
+    """
+    __slots__ = ("src", "stem", "rel", "dest_dir", "pdf_name", "dest_file")
+
+    def __init__(self, src: str, stem: str, rel: str):
+        self.src = src  # absolute path of the Word document
+        self.stem = stem
+        self.rel = rel  # subfolder relative to the source root, "" for the root
+        self.dest_dir = self.pdf_name = self.dest_file = ""
+
+
+# ----------------------- Conversion (pool processes) -----------------------
+# Word constants, named after their wd* counterparts in the type library
+WD_ALERTS_NONE = 0
+WD_DO_NOT_SAVE_CHANGES = 0
+WD_EXPORT_FORMAT_PDF = 17
+WD_EXPORT_OPTIMIZE_FOR_PRINT = 0
+
+# HRESULTs meaning the Word process behind a cached instance has gone away
+_RPC_GONE = (
+    -2147023174,  # RPC_S_SERVER_UNAVAILABLE
+    -2147417848,  # RPC_E_DISCONNECTED
+)
+
+# Each pool process keeps one Word instance alive for all of its tasks,
+# along with its Documents collection so each task skips that property get.
+_word = None
+_docs = None
+
+# Options that start background work inside Word during a batch. Word
+# saves Options to the user's settings, so the originals are put back
+# before quitting.
+_BATCH_OPTIONS = {
+    "SaveInterval": 0,  # no AutoRecover saves
+    "CheckSpellingAsYouType": False,
+    "CheckGrammarAsYouType": False,
+}
+_saved_options = {}
+
+
+def _quit_word():
+    global _word, _docs
+    if _word is not None:
+        try:
+            for name, value in _saved_options.items():
+                setattr(_word.Options, name, value)
+        except Exception:
+            pass
+        _saved_options.clear()
+        try:
+            _word.Quit()
+        except Exception:
+            pass
+        _word = _docs = None
+        pythoncom.CoUninitialize()
+
+
+atexit.register(_quit_word)
+
+
+def _get_word():
+    """Return this process's Word instance, starting it on first use."""
+    global _word, _docs
+    if _word is None:
+        pythoncom.CoInitialize()
+        # DispatchEx always starts a private instance instead of attaching
+        # to a Word window the user already has open.
+        word = win32com.client.DispatchEx("Word.Application")
+        try:
+            # Early binding: calls go straight to DISPIDs from the cached
+            # type library instead of a GetIDsOfNames lookup each time.
+            word = win32com.client.gencache.EnsureDispatch(word._oleobj_)
+        except Exception:
+            pass  # no usable type library cache; stay late-bound
+        word.Visible = False
+        word.DisplayAlerts = WD_ALERTS_NONE
+        options = word.Options
+        for name, value in _BATCH_OPTIONS.items():
+            try:
+                _saved_options[name] = getattr(options, name)
+                setattr(options, name, value)
+            except Exception:
+                _saved_options.pop(name, None)
+        _docs = word.Documents
+        _word = word
+    return _word
+
+
+def _convert_one(doc_path: str, dest_file: str) -> None:
+    """Convert a single Word document to PDF. Runs inside a pool process."""
+    try:
+        _export_pdf(doc_path, dest_file)
+    except pythoncom.com_error as e:
+        if e.hresult not in _RPC_GONE:
+            raise
+        # Word was closed or crashed since the last task; start a new one
+        _quit_word()
+        _export_pdf(doc_path, dest_file)
+
+
+def _export_pdf(doc_path: str, dest_file: str) -> None:
+    _get_word()
+    # Spell out the defaults that would otherwise add work per document:
+    # MRU registry writes, conversion/encoding prompts, repair scans.
+    doc = _docs.Open(
+        FileName=doc_path,
+        ConfirmConversions=False,
+        ReadOnly=True,
+        AddToRecentFiles=False,
+        Visible=False,
+        OpenAndRepair=False,
+        NoEncodingDialog=True,
+    )
+    try:
+        doc.ExportAsFixedFormat(
+            dest_file,
+            WD_EXPORT_FORMAT_PDF,
+            OpenAfterExport=False,
+            OptimizeFor=WD_EXPORT_OPTIMIZE_FOR_PRINT,
+        )
+    finally:
+        doc.Close(SaveChanges=WD_DO_NOT_SAVE_CHANGES)
+
+
+def find_soffice() -> Optional[str]:
+    """Locate the LibreOffice command-line binary, or None if not installed."""
+    found = shutil.which("soffice")
+    if found:
+        return found
+    for base in (os.environ.get("PROGRAMFILES"), os.environ.get("PROGRAMFILES(X86)")):
+        if base:
+            candidate = Path(base) / "LibreOffice" / "program" / "soffice.exe"
+            if candidate.is_file():
+                return str(candidate)
+    return None
+
+
+def _convert_batch_soffice(soffice: str, jobs: List[Job]) -> List[Optional[str]]:
+    """Convert documents with a single headless LibreOffice run.
+
+    jobs share one destination folder and have distinct stems. Returns an
+    error message (or None) per job.
+    """
+    dest_dir = jobs[0].dest_dir
+    # LibreOffice names its output after the source and overwrites silently,
+    # so convert into a scratch folder and move each PDF to its final name.
+    out_dir = Path(tempfile.mkdtemp(prefix=".bulkprinter-", dir=dest_dir))
+    # A private profile keeps the run from handing off to (and waiting on)
+    # a LibreOffice window the user already has open.
+    profile = Path(tempfile.gettempdir()) / "BulkPrinter-soffice-profile"
+    cmd = [
+        soffice, f"-env:UserInstallation={profile.as_uri()}",
+        "--headless", "--norestore",
+        "--convert-to", "pdf", "--outdir", str(out_dir),
+        *(job.src for job in jobs),
+    ]
+    try:
+        result = subprocess.run(
+            cmd, capture_output=True, text=True,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+        errors = []
+        for job in jobs:
+            produced = out_dir / f"{job.stem}.pdf"
+            if produced.is_file():
+                os.replace(produced, job.dest_file)
+                errors.append(None)
+            else:
+                detail = result.stderr.strip().splitlines()[-1:] or [f"exit code {result.returncode}"]
+                errors.append(f"LibreOffice produced no PDF ({detail[0]})")
+        return errors
+    finally:
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+
+class WordPool:
+    """Word instances that outlive a single conversion run.
+
+    Backed by a ProcessPoolExecutor whose processes each hold one Word
+    instance (see _get_word), so only the first batch of a session pays
+    Word's startup cost.
+    """
+
+    MAX_SIZE = 4  # Word rarely scales past 3-4 concurrent instances
+
+    def __init__(self, size: int = MAX_SIZE):
+        self.size = max(1, min(size, os.cpu_count() or 1))
+        self._executor = None
+
+    def acquire(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.size)
+        return self._executor
+
+    def release(self, executor: ProcessPoolExecutor, broken: bool = False):
+        """Hand an executor back; a broken one is dropped so the next run starts fresh."""
+        if broken and executor is self._executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def shutdown(self):
+        """Stop the pool processes, which quit their Word instances on exit."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+# ----------------------- Worker Threads -----------------------
+class ScanWorker(QThread):
+    """Background thread that walks the source tree and streams back Jobs."""
+    found_batch = Signal(list)       # list of Job
+    progress = Signal(int)           # documents found so far
+    finished_signal = Signal(bool)   # True if the scan was cancelled
+
+    BATCH_SIZE = 500  # documents per found_batch signal
+
+    def __init__(self, root: str, suffixes: Tuple[str, ...], parent=None):
+        super().__init__(parent)
+        self.root = root
+        self.suffixes = suffixes
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        # Every match starts with root plus a separator, so the relative
+        # folder is a plain slice; files directly in root slice to "".
+        prefix_len = len(os.path.join(self.root, ""))
+        found = 0
+        batch = []
+        for path in _walk(self.root, self.suffixes, lambda: self._cancelled):
+            parent, name = os.path.split(path)
+            batch.append(Job(path, os.path.splitext(name)[0], parent[prefix_len:]))
+            if len(batch) >= self.BATCH_SIZE:
+                found += len(batch)
+                self.found_batch.emit(batch)
+                self.progress.emit(found)
+                batch = []
+        if batch:
+            self.found_batch.emit(batch)
+            self.progress.emit(found + len(batch))
+        self.finished_signal.emit(self._cancelled)
 
 
-# ----------------------- Worker Thread -----------------------
 class PrintToPdfWorker(QThread):
-    """Background thread that opens Word docs and saves as PDF."""
+    """Background thread that fans PDF conversions out to Word or LibreOffice."""
     progress = Signal(int, int)      # current, total
-    log_message = Signal(str)        # log line
+    log_message = Signal(str)        # one or more newline-joined log lines
     finished_signal = Signal(int)    # total files converted
 
-    WD_EXPORT_PDF = 17  # wdExportFormatPDF
+    QUEUE_DEPTH = 2  # documents queued per Word worker ahead of time
+    SOFFICE_BATCH = 25  # documents per LibreOffice run
+    FLUSH_INTERVAL = 0.05  # seconds between batched log updates
 
     def __init__(self, destination: str,
-                 file_list: List[Tuple[Path, Path]], parent=None):
+                 file_list: List[Job],
+                 word_pool: WordPool, soffice: Optional[str] = None,
+                 hybrid: bool = False, parent=None):
         super().__init__(parent)
-        self.destination = Path(destination)
-        self.file_list = file_list  # list of (doc_path, relative_subfolder)
+        # Resolved once here so no per-file path is resolved again later
+        self.destination = str(Path(destination).resolve())
+        self.file_list = file_list
+        self.word_pool = word_pool
+        self.soffice = soffice  # convert with LibreOffice when set
+        self.hybrid = hybrid  # with soffice: only .docx goes to LibreOffice
+        self._cancelled = False
+        self._done = 0
+        self._converted = 0
+        self._last_pct = -1
+        self._log_buffer = []
+        self._last_flush = 0.0
+
+    def cancel(self):
+        """Stop handing out documents; conversions already running finish."""
+        self._cancelled = True
 
     def run(self):
-        pythoncom.CoInitialize()
-        word = None
         total = len(self.file_list)
-        converted = 0
+        jobs = self._plan_jobs()
+
+        if self.soffice and self.hybrid:
+            # .docx is handled well by LibreOffice; the binary .doc format
+            # still goes through Word. Both run at the same time.
+            docx_jobs = [job for job in jobs if job.src.lower().endswith(".docx")]
+            doc_jobs = [job for job in jobs if not job.src.lower().endswith(".docx")]
+            self._convert_with_word(doc_jobs, docx_jobs)
+        elif self.soffice:
+            self._convert_with_soffice(jobs)
+        else:
+            self._convert_with_word(jobs)
+
+        if self._cancelled and self._done < total:
+            self._log(f"⚠ Cancelled — {total - self._done} document(s) skipped.")
+
+        self._flush_log()
+        self.finished_signal.emit(self._converted)
+
+    def _plan_jobs(self) -> List[Job]:
+        """Pick every output name up front.
+
+        Conversions finish out of order, so names claimed earlier in this
+        batch must not be reused.
+        """
+        taken = {}  # dest_dir -> lowercased names on disk or claimed by this batch
+        next_counter = {}  # (dest_dir, stem) -> next " (n)" suffix to try
+        # Loop-invariant lookups bound once; this runs per document
+        dest_root = self.destination
+        join = os.path.join
+        get_taken = taken.get
+        get_counter = next_counter.get
+        for job in self.file_list:
+            stem = job.stem
+            rel = job.rel
+            dest_dir = join(dest_root, rel) if rel else dest_root
+            names = get_taken(dest_dir)
+            if names is None:
+                # First document for this folder: create and list it once
+                os.makedirs(dest_dir, exist_ok=True)
+                names = taken[dest_dir] = self._existing_names(dest_dir)
+
+            key = (dest_dir, stem.lower())
+            counter = get_counter(key, 0)
+            pdf_name = f"{stem} ({counter}).pdf" if counter else f"{stem}.pdf"
+
+            # Handle duplicates, resuming after the last suffix handed out
+            # for this stem rather than probing (1), (2), ... again
+            while pdf_name.lower() in names:
+                counter += 1
+                pdf_name = f"{stem} ({counter}).pdf"
+            next_counter[key] = counter + 1
+            names.add(pdf_name.lower())
+            job.dest_dir = dest_dir
+            job.pdf_name = pdf_name
+            job.dest_file = join(dest_dir, pdf_name)
+        return self.file_list
 
+    @staticmethod
+    def _existing_names(dest_dir: str) -> set:
+        """Lowercased names already in dest_dir, read with a single listing."""
         try:
-            word = win32com.client.Dispatch("Word.Application")
-            word.Visible = False
-            word.DisplayAlerts = 0  # wdAlertsNone
-
-            for i, (doc_path, rel_folder) in enumerate(self.file_list):
-                try:
-                    dest_dir = self.destination / rel_folder
-                    dest_dir.mkdir(parents=True, exist_ok=True)
-
-                    pdf_name = doc_path.stem + ".pdf"
-                    dest_file = dest_dir / pdf_name
-
-                    # Handle duplicates
-                    if dest_file.exists():
-                        stem = doc_path.stem
-                        counter = 1
-                        while dest_file.exists():
-                            dest_file = dest_dir / f"{stem} ({counter}).pdf"
-                            counter += 1
-
-                    self.log_message.emit(f"  Converting: {rel_folder / doc_path.name}")
-
-                    doc = word.Documents.Open(str(doc_path.resolve()), ReadOnly=True)
-                    doc.ExportAsFixedFormat(
-                        str(dest_file.resolve()),
-                        self.WD_EXPORT_PDF,
-                        OpenAfterExport=False,
-                        OptimizeFor=0,  # wdExportOptimizeForPrint
-                    )
-                    doc.Close(SaveChanges=0)
-                    converted += 1
-                    self.log_message.emit(f"✓ {rel_folder / pdf_name}")
-                except Exception as e:
-                    self.log_message.emit(f"✗ ERROR: {doc_path.name} — {e}")
+            with os.scandir(dest_dir) as it:
+                return {entry.name.lower() for entry in it}
+        except OSError:
+            return set()
+
+    def _log(self, text: str):
+        self._log_buffer.append(text)
+        self._flush_log(force=False)
+
+    def _flush_log(self, force: bool = True):
+        """Emit buffered log lines as one signal, at most every FLUSH_INTERVAL."""
+        now = time.monotonic()
+        if self._log_buffer and (force or now - self._last_flush >= self.FLUSH_INTERVAL):
+            self.log_message.emit("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+            self._last_flush = now
+
+    def _record(self, job: Job, error: Optional[str]):
+        if error is None:
+            self._converted += 1
+            self._log(f"✓ {os.path.join(job.rel, job.pdf_name)}")
+        else:
+            self._log(f"✗ ERROR: {os.path.basename(job.src)} — {error}")
+        self._done += 1
+
+        # Only wake the GUI when the visible percentage moves
+        total = len(self.file_list)
+        pct = self._done * 100 // total
+        if pct != self._last_pct or self._done == total:
+            self._last_pct = pct
+            self.progress.emit(self._done, total)
+
+    def _convert_with_word(self, jobs, soffice_jobs=()):
+        """Convert jobs through the Word pool.
+
+        soffice_jobs are converted by LibreOffice on a helper thread at the
+        same time, one batch in flight, with results merged into the same
+        progress and log.
+        """
+        total = len(jobs)
+        batches = self._soffice_batches(soffice_jobs)
+        soffice_runner = ThreadPoolExecutor(max_workers=1) if soffice_jobs else None
+        soffice_busy = False
+        broken = False
+        pool = self.word_pool.acquire()
+        # Bound once rather than looked up on every pass of the loop
+        submit = pool.submit
+        record = self._record
+        max_in_flight = self.word_pool.size * self.QUEUE_DEPTH
+        try:
+            # Only a few documents per worker are submitted at a time so
+            # that a cancel takes effect without draining a long queue.
+            in_flight = {}
+            next_job = 0
+            while True:
+                while (not broken and not self._cancelled and next_job < total
+                       and len(in_flight) < max_in_flight):
+                    job = jobs[next_job]
                     try:
-                        if word and word.Documents.Count > 0:
-                            word.Documents.Item(1).Close(SaveChanges=0)
-                    except Exception:
-                        pass
-
-                self.progress.emit(i + 1, total)
-
+                        # Both paths are already absolute; see scan_source and __init__
+                        in_flight[submit(_convert_one, job.src, job.dest_file)] = job
+                    except BrokenProcessPool:
+                        broken = True
+                        break
+                    next_job += 1
+                if broken and not self._cancelled:
+                    # A broken pool takes no more work: fail the Word jobs not
+                    # yet submitted, and let any LibreOffice batches finish
+                    for job in jobs[next_job:]:
+                        record(job, "Word process died before this document was converted")
+                    next_job = total
+                if soffice_runner and not soffice_busy and not self._cancelled:
+                    batch = next(batches, None)
+                    if batch is not None:
+                        in_flight[soffice_runner.submit(self._run_soffice_batch, batch)] = batch
+                        soffice_busy = True
+                if not in_flight:
+                    break
+
+                # The timeout lets buffered log lines go out while a slow
+                # document is still converting
+                finished, _ = wait(in_flight, timeout=self.FLUSH_INTERVAL,
+                                   return_when=FIRST_COMPLETED)
+                self._flush_log(force=False)
+                for future in finished:
+                    job = in_flight.pop(future)
+                    if isinstance(job, list):  # a LibreOffice batch
+                        soffice_busy = False
+                        for batch_job, error in zip(job, future.result()):
+                            record(batch_job, error)
+                        continue
+                    try:
+                        future.result()
+                        record(job, None)
+                    except BrokenProcessPool as e:
+                        broken = True
+                        record(job, f"Word process died ({e})")
+                    except Exception as e:
+                        record(job, str(e))
         except Exception as e:
-            self.log_message.emit(f"✗ FATAL: Could not start Word — {e}")
+            broken = True
+            self._log(f"✗ FATAL: Could not start Word — {e}")
         finally:
-            if word:
-                try:
-                    word.Quit()
-                except Exception:
-                    pass
-            pythoncom.CoUninitialize()
+            if soffice_runner:
+                soffice_runner.shutdown(wait=True)
+            self.word_pool.release(pool, broken)
+
+    def _soffice_batches(self, jobs):
+        """Group jobs by destination folder into LibreOffice-sized batches.
+
+        A batch never holds two documents with the same stem, since
+        LibreOffice would write both to the same PDF name.
+        """
+        groups = {}
+        for job in jobs:
+            groups.setdefault(job.dest_dir, []).append(job)
+        for pending in groups.values():
+            while pending:
+                batch, stems, rest = [], set(), []
+                for job in pending:
+                    stem = job.stem.lower()
+                    if stem in stems or len(batch) >= self.SOFFICE_BATCH:
+                        rest.append(job)
+                    else:
+                        stems.add(stem)
+                        batch.append(job)
+                yield batch
+                pending = rest
+
+    def _run_soffice_batch(self, batch) -> List[Optional[str]]:
+        try:
+            return _convert_batch_soffice(self.soffice, batch)
+        except Exception as e:
+            return [f"Could not run LibreOffice — {e}"] * len(batch)
 
-        self.finished_signal.emit(converted)
+    def _convert_with_soffice(self, jobs):
+        for batch in self._soffice_batches(jobs):
+            if self._cancelled:
+                break
+            for job, error in zip(batch, self._run_soffice_batch(batch)):
+                self._record(job, error)
+            self._flush_log()
 
 
 # ----------------------- Main Window -----------------------
 class BulkPrinterWindow(QWidget):
+    LOG_MAX_LINES = 5000
     def __init__(self):
         super().__init__()
         self._is_dark = False
         Colors.set_theme(self._is_dark)
         self.worker = None
+        self.scan_worker = None
+        self._scan_extensions = ()
+        self.word_pool = WordPool()
         self.init_ui()
         self.apply_theme()
 
@@ -351,6 +873,32 @@ class BulkPrinterWindow(QWidget):
         ft_w = QWidget(); ft_w.setLayout(ft_row)
         opt_card.add_widget(ft_w)
 
+        self.soffice_path = find_soffice()
+        self.word_rb = QRadioButton("Microsoft Word")
+        self.soffice_rb = QRadioButton("LibreOffice")
+        self.hybrid_rb = QRadioButton("Hybrid")
+        if self.soffice_path:
+            self.soffice_rb.setToolTip(f"Batch conversion with {self.soffice_path}")
+            self.hybrid_rb.setToolTip(".docx with LibreOffice and .doc with Word, side by side")
+        else:
+            self.soffice_rb.setEnabled(False)
+            self.soffice_rb.setToolTip("LibreOffice (soffice) was not found on this machine.")
+        self.hybrid_rb.setEnabled(bool(self.soffice_path) and HAS_WIN32)
+        if self.soffice_path and not HAS_WIN32:
+            self.soffice_rb.setChecked(True)
+        else:
+            self.word_rb.setChecked(True)
+        be_row = QHBoxLayout()
+        be_label = QLabel("Converter:")
+        be_label.setFont(QFont("Segoe UI", 9))
+        be_row.addWidget(be_label)
+        be_row.addWidget(self.word_rb)
+        be_row.addWidget(self.soffice_rb)
+        be_row.addWidget(self.hybrid_rb)
+        be_row.addStretch()
+        be_w = QWidget(); be_w.setLayout(be_row)
+        opt_card.add_widget(be_w)
+
         if not HAS_WIN32:
             warn = QLabel("⚠ pywin32 not installed — Word-to-PDF conversion unavailable.")
             warn.setStyleSheet("color: #EF4444; font-weight: bold;")
@@ -369,6 +917,11 @@ class BulkPrinterWindow(QWidget):
         self.copy_btn.clicked.connect(self.start_copy)
         btn_row.addWidget(self.copy_btn)
 
+        self.cancel_btn = ModernButton("Cancel", variant="danger")
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.clicked.connect(self.cancel_copy)
+        btn_row.addWidget(self.cancel_btn)
+
         self.clear_btn = ModernButton("Clear Log", variant="secondary")
         self.clear_btn.clicked.connect(self.clear_log)
         btn_row.addWidget(self.clear_btn)
@@ -384,8 +937,10 @@ class BulkPrinterWindow(QWidget):
         root.addWidget(self.progress_bar)
 
         # ---- Log ----
-        self.log = QTextEdit()
+        self.log = QPlainTextEdit()
         self.log.setReadOnly(True)
+        # Oldest lines are dropped past this, so long runs don't grow memory
+        self.log.setMaximumBlockCount(self.LOG_MAX_LINES)
         self.log.setFont(QFont("Consolas", 9))
         root.addWidget(self.log, 1)
 
@@ -395,7 +950,7 @@ class BulkPrinterWindow(QWidget):
         root.addWidget(self.status)
 
         # Internal state
-        self.file_list: List[Tuple[Path, Path]] = []
+        self.file_list: List[Job] = []
 
     # ---- Theme ----
     def toggle_theme(self):
@@ -405,53 +960,7 @@ class BulkPrinterWindow(QWidget):
         self.apply_theme()
 
     def apply_theme(self):
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: {Colors.BACKGROUND};
-                color: {Colors.TEXT};
-                font-family: 'Segoe UI';
-            }}
-            QLineEdit {{
-                background-color: {Colors.INPUT_BG};
-                color: {Colors.TEXT};
-                border: 1px solid {Colors.BORDER};
-                border-radius: 4px;
-                padding: 4px 6px;
-                font-size: 11px;
-            }}
-            QLineEdit:focus {{
-                border-color: {Colors.BORDER_FOCUS};
-            }}
-            QTextEdit {{
-                background-color: {Colors.INPUT_BG};
-                color: {Colors.TEXT};
-                border: 1px solid {Colors.BORDER};
-                border-radius: 4px;
-                padding: 4px;
-                font-size: 10px;
-            }}
-            QCheckBox {{
-                color: {Colors.TEXT};
-                font-size: 11px;
-                spacing: 6px;
-            }}
-            QProgressBar {{
-                background-color: {Colors.INPUT_BG};
-                border: 1px solid {Colors.BORDER};
-                border-radius: 4px;
-                text-align: center;
-                height: 18px;
-                font-size: 10px;
-                color: {Colors.TEXT};
-            }}
-            QProgressBar::chunk {{
-                background-color: {Colors.PRIMARY};
-                border-radius: 3px;
-            }}
-            QLabel {{
-                color: {Colors.TEXT};
-            }}
-        """)
+        self.setStyleSheet(STYLESHEETS[Colors.is_dark]["window"])
         # Refresh styled widgets
         for child in self.findChildren(ModernCard):
             child.update_style()
@@ -476,7 +985,9 @@ class BulkPrinterWindow(QWidget):
             QMessageBox.warning(self, "No Source", "Please select a source folder first.")
             return
 
-        src_path = Path(src)
+        # Resolve the root once; every path scandir yields under it is then
+        # already absolute, so no document path needs resolving later.
+        src_path = Path(src).resolve()
         if not src_path.is_dir():
             QMessageBox.warning(self, "Invalid Path", f"Source folder does not exist:\n{src}")
             return
@@ -485,49 +996,82 @@ class BulkPrinterWindow(QWidget):
         self.log.clear()
         self.progress_bar.setValue(0)
 
-        # Gather selected extensions
+        # Gather selected extensions, lowercased and with the dot, so the walk
+        # can test each name with a single endswith call
         extensions = set()
         if self.docx_cb.isChecked():
-            extensions.add("docx")
+            extensions.add(".docx")
         if self.doc_cb.isChecked():
-            extensions.add("doc")
+            extensions.add(".doc")
+        suffixes = tuple(extensions)
 
         if not extensions:
             QMessageBox.warning(self, "No File Types", "Select at least one Word file type to scan for.")
             return
 
-        # Find all matching Word docs in subfolders
-        for f in sorted(src_path.rglob("*")):
-            if f.is_file() and f.suffix.lstrip(".").lower() in extensions:
-                rel = f.parent.relative_to(src_path)
-                self.file_list.append((f, rel))
+        # Find all matching Word docs in subfolders, off the GUI thread
+        self._scan_extensions = extensions
+        self.scan_worker = ScanWorker(str(src_path), suffixes)
+        self.scan_worker.found_batch.connect(self.on_found_batch)
+        self.scan_worker.progress.connect(self.on_scan_progress)
+        self.scan_worker.finished_signal.connect(self.on_scan_finished)
+        self.scan_btn.setEnabled(False)
+        self.copy_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(True)
+        self.status.setText("Scanning…")
+        self.scan_worker.start()
+
+    def on_found_batch(self, batch):
+        self.file_list.extend(batch)
+
+    def on_scan_progress(self, found):
+        self.status.setText(f"Scanning… {found} docs found")
+
+    def on_scan_finished(self, cancelled):
+        self.scan_worker.wait()
+        self.scan_worker = None
+        self.scan_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(False)
+
+        if cancelled:
+            self.file_list.clear()
+            self.log_line("⚠ Scan cancelled.")
+            self.status.setText("Scan cancelled.")
+            self.copy_btn.setEnabled(False)
+            return
 
         if not self.file_list:
-            ext_str = ", ".join(f".{e}" for e in sorted(extensions))
+            ext_str = ", ".join(sorted(self._scan_extensions))
             self.log_line(f"⚠ No Word documents found matching: {ext_str}")
             self.status.setText("No documents found.")
             self.copy_btn.setEnabled(False)
             return
 
+        # Batches arrive in walk order; list them in path order
+        self.file_list.sort(key=lambda job: os.path.normcase(job.src))
+
         # Group by subfolder for display
         folders = {}
-        for pdf, rel in self.file_list:
-            key = str(rel) if str(rel) != '.' else '(root)'
-            folders.setdefault(key, []).append(pdf.name)
+        for job in self.file_list:
+            key = job.rel or '(root)'
+            folders.setdefault(key, []).append(os.path.basename(job.src))
 
-        self.log_line(f"Found {len(self.file_list)} Word doc(s) across {len(folders)} subfolder(s):\n")
+        # Build the whole listing first; one append instead of one per line
+        lines = [f"Found {len(self.file_list)} Word doc(s) across {len(folders)} subfolder(s):\n"]
         for folder_name, files in sorted(folders.items()):
-            self.log_line(f"  📁 {folder_name}  ({len(files)} docs)")
-            for f in files:
-                self.log_line(f"      • {f}  →  {Path(f).stem}.pdf")
-            self.log_line("")
+            lines.append(f"  📁 {folder_name}  ({len(files)} docs)")
+            lines.extend(f"      • {f}  →  {os.path.splitext(f)[0]}.pdf" for f in files)
+            lines.append("")
+        self.log_line("\n".join(lines))
 
         self.status.setText(f"Scanned: {len(self.file_list)} docs in {len(folders)} folders. Ready to print.")
         self.copy_btn.setEnabled(True)
 
     # ---- Print to PDF ----
     def start_copy(self):
-        if not HAS_WIN32:
+        hybrid = self.hybrid_rb.isChecked()
+        use_soffice = hybrid or self.soffice_rb.isChecked()
+        if (hybrid or not use_soffice) and not HAS_WIN32:
             QMessageBox.critical(self, "Missing Dependency",
                                  "pywin32 is required for Word-to-PDF conversion.\n"
                                  "Install it with: pip install pywin32")
@@ -554,16 +1098,31 @@ class BulkPrinterWindow(QWidget):
         self.scan_btn.setEnabled(False)
         self.copy_btn.setEnabled(False)
         self.progress_bar.setValue(0)
-        self.log_line("\n— Starting Word → PDF conversion —\n")
+        converter = "LibreOffice + Word" if hybrid else "LibreOffice" if use_soffice else "Word"
+        self.log_line(f"\n— Starting Word → PDF conversion ({converter}) —\n")
 
         self.worker = PrintToPdfWorker(
             destination=dst,
-            file_list=self.file_list
+            file_list=self.file_list,
+            word_pool=self.word_pool,
+            soffice=self.soffice_path if use_soffice else None,
+            hybrid=hybrid,
         )
         self.worker.progress.connect(self.on_progress)
         self.worker.log_message.connect(self.log_line)
         self.worker.finished_signal.connect(self.on_finished)
         self.worker.start()
+        self.cancel_btn.setEnabled(True)
+
+    def cancel_copy(self):
+        if self.scan_worker:
+            self.scan_worker.cancel()
+            self.cancel_btn.setEnabled(False)
+            self.status.setText("Cancelling scan…")
+        elif self.worker:
+            self.worker.cancel()
+            self.cancel_btn.setEnabled(False)
+            self.status.setText("Cancelling — waiting for running conversions…")
 
     def on_progress(self, current, total):
         pct = int(current / total * 100) if total else 0
@@ -576,11 +1135,24 @@ class BulkPrinterWindow(QWidget):
         self.progress_bar.setValue(100)
         self.scan_btn.setEnabled(True)
         self.copy_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(False)
+        self.worker.wait()
         self.worker = None
 
+    def closeEvent(self, event):
+        # Let a running batch wind down instead of destroying a live QThread
+        if self.scan_worker:
+            self.scan_worker.cancel()
+            self.scan_worker.wait()
+        if self.worker:
+            self.worker.cancel()
+            self.worker.wait()
+        self.word_pool.shutdown()
+        super().closeEvent(event)
+
     # ---- Helpers ----
     def log_line(self, text):
-        self.log.append(text)
+        self.log.appendPlainText(text)
 
     def clear_log(self):
         self.log.clear()
@@ -589,6 +1161,7 @@ class BulkPrinterWindow(QWidget):
 
 
 def main():
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = BulkPrinterWindow()
     window.show()
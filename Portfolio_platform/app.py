@@ -13,25 +13,61 @@ A Streamlit-based interactive dashboard for portfolio analysis with:
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import numpy as np
+import atexit
+import hashlib
+import itertools
 import json
+import logging
 import os
+import shutil
+import struct
+import tempfile
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
-import yfinance as yf
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import requests_cache
+    HAS_REQUESTS_CACHE = True
+except ImportError:
+    HAS_REQUESTS_CACHE = False
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
 from main import (
     Position,
     WatchItem,
     analyse_portfolio,
+    analyse_portfolio_batch,
     analyse_watchlist,
     simulate_gbm_price,
     portfolio_summary,
-    predict_position,
+    predict_positions_batch,
     add_positions,
 )
 
+logger = logging.getLogger(__name__)
+
+# What-if "Add by" options, shared by the radio and the Add Positions handler
+ALLOC_DOLLARS, ALLOC_SHARES = "$ Amount", "Shares"
+
+# Largest positions shown as their own allocation pie slice; the rest are "Other"
+ALLOCATION_PIE_SLICES = 10
+
 # Page configuration
 st.set_page_config(
     page_title="Portfolio Analysis Dashboard",
@@ -85,6 +121,7 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+@lru_cache(maxsize=256)
 def normalize_ticker_for_yahoo(ticker: str) -> str:
     """Convert ticker symbols to Yahoo Finance format.
     
@@ -101,13 +138,61 @@ def normalize_ticker_for_yahoo(ticker: str) -> str:
     return ticker_map.get(ticker.upper(), ticker.upper())
 
 
-@st.cache_data(ttl=60, show_spinner=False)  # Cache for 60 seconds
+# Seconds Yahoo responses stay fresh on disk; matches the price cache TTLs
+# (fetch_stock_data, fetch_recent_closes, fetch_multiple_stocks)
+YAHOO_CACHE_SECONDS = 30
+
+
+@st.cache_resource(show_spinner=False)
+def get_yahoo_session():
+    """Return a disk-backed HTTP session for Yahoo requests, or None.
+    
+    Responses are kept in .yf_cache.sqlite so a restarted app can reuse
+    them instead of refetching every ticker. None (yfinance's own session)
+    is returned when requests_cache is not installed or the installed
+    yfinance only accepts its curl_cffi sessions.
+    """
+    if not HAS_REQUESTS_CACHE:
+        return None
+    import yfinance as yf
+    session = requests_cache.CachedSession(".yf_cache", expire_after=YAHOO_CACHE_SECONDS)
+    try:
+        yf.Ticker("SPY", session=session)
+    except Exception:
+        return None
+    return session
+
+
+def _quote_from_closes(closes: pd.Series, name: str) -> Optional[Dict]:
+    """Build a quote dict from a year of daily closing prices, oldest first."""
+    closes = closes.dropna()
+    if closes.empty:
+        return None
+    
+    current_price = closes.iloc[-1]
+    prev_close = closes.iloc[-2] if len(closes) > 1 else current_price
+    today_return_pct = ((current_price - prev_close) / prev_close) * 100 if prev_close > 0 else 0
+    
+    # Calculate YTD return
+    year_start_price = closes.iloc[0]
+    ytd_return_pct = ((current_price - year_start_price) / year_start_price) * 100 if year_start_price > 0 else 0
+    
+    return {
+        "current_price": float(current_price),
+        "today_return_pct": float(today_return_pct),
+        "ytd_return_pct": float(ytd_return_pct),
+        "name": name,
+    }
+
+
+@st.cache_data(ttl=30, show_spinner=False)  # Prices move constantly
 def fetch_stock_data(ticker: str) -> Optional[Dict]:
     """Fetch real-time stock data from Yahoo Finance."""
+    import yfinance as yf
     try:
         # Normalize ticker for Yahoo Finance
         yahoo_ticker = normalize_ticker_for_yahoo(ticker)
-        stock = yf.Ticker(yahoo_ticker)
+        stock = yf.Ticker(yahoo_ticker, session=get_yahoo_session())
         
         # Get historical data first (more reliable)
         hist = stock.history(period="1y")
@@ -131,17 +216,6 @@ def fetch_stock_data(ticker: str) -> Optional[Dict]:
                 pass
             return None
         
-        current_price = hist['Close'].iloc[-1]
-        prev_close = hist['Close'].iloc[-2] if len(hist) > 1 else current_price
-        today_return_pct = ((current_price - prev_close) / prev_close) * 100 if prev_close > 0 else 0
-        
-        # Calculate YTD return
-        if len(hist) > 0:
-            year_start_price = hist['Close'].iloc[0]
-            ytd_return_pct = ((current_price - year_start_price) / year_start_price) * 100 if year_start_price > 0 else 0
-        else:
-            ytd_return_pct = 0
-        
         # Try to get company name, but don't fail if it's unavailable
         try:
             info = stock.info
@@ -149,33 +223,131 @@ def fetch_stock_data(ticker: str) -> Optional[Dict]:
         except:
             name = ticker
         
-        return {
-            "current_price": float(current_price),
-            "today_return_pct": float(today_return_pct),
-            "ytd_return_pct": float(ytd_return_pct),
-            "name": name,
-        }
+        return _quote_from_closes(hist['Close'], name)
     except Exception as e:
         # Silently return None on error - errors are handled gracefully in the UI
         # This prevents console spam from delisted/invalid tickers
         return None
 
 
-@st.cache_data(ttl=60, show_spinner=False)
-def fetch_multiple_stocks(tickers: List[str]) -> Dict[str, Dict]:
-    """Fetch data for multiple stocks efficiently."""
-    results = {}
-    for ticker in tickers:
-        data = fetch_stock_data(ticker)
+@st.cache_data(ttl=86400, show_spinner=False)  # Names rarely change
+def fetch_company_name(ticker: str) -> str:
+    """Look up a company's display name, falling back to the ticker."""
+    import yfinance as yf
+    try:
+        info = yf.Ticker(normalize_ticker_for_yahoo(ticker), session=get_yahoo_session()).info
+        return info.get("longName", info.get("shortName", ticker))
+    except Exception:
+        return ticker
+
+
+def _download_closes(yahoo_tickers: Tuple[str, ...], period: str) -> Dict[str, pd.Series]:
+    """Daily closes per Yahoo ticker from one batched yf.download call.
+    
+    Raises when the download fails or returns no closes at all, so the
+    cached callers don't keep an empty result for their whole TTL
+    (st.cache_data does not cache exceptions).
+    """
+    import yfinance as yf
+    history = yf.download(
+        list(yahoo_tickers),
+        period=period,
+        group_by="ticker",
+        auto_adjust=True,  # same prices as Ticker.history
+        threads=True,
+        progress=False,
+        session=get_yahoo_session(),
+    )
+    
+    closes = {}
+    for yahoo_ticker in yahoo_tickers:
+        try:
+            if isinstance(history.columns, pd.MultiIndex):
+                series = history[yahoo_ticker]["Close"].dropna()
+            else:
+                series = history["Close"].dropna()
+        except KeyError:
+            continue
+        if not series.empty:
+            closes[yahoo_ticker] = series
+    if not closes:
+        raise RuntimeError(f"yf.download returned no {period} closes")
+    return closes
+
+
+@st.cache_data(ttl=900, show_spinner=False)  # Daily bars; only the YTD base comes from here
+def fetch_year_closes(yahoo_tickers: Tuple[str, ...]) -> Dict[str, pd.Series]:
+    """A year of daily closes for each ticker."""
+    return _download_closes(yahoo_tickers, "1y")
+
+
+@st.cache_data(ttl=30, show_spinner=False)  # Prices move constantly
+def fetch_recent_closes(yahoo_tickers: Tuple[str, ...]) -> Dict[str, pd.Series]:
+    """The last few daily closes for each ticker, including today's price."""
+    return _download_closes(yahoo_tickers, "5d")
+
+
+# Last successful quote per ticker, served when Yahoo can't be reached
+_last_good_quotes: Dict[str, Dict] = {}
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_multiple_stocks(tickers: List[str], with_names: bool = False) -> Dict[str, Dict]:
+    """Fetch data for multiple stocks efficiently.
+    
+    Quotes combine a year of daily closes (cached 15 minutes) with the
+    last few days (cached 30 seconds), each fetched for all tickers in one
+    batched yf.download call. Tickers missing from those fall back to
+    fetch_stock_data on a thread pool, and then to their last good quote.
+    Company names need a separate request per ticker, so they are only
+    looked up when with_names is set; otherwise "name" is the ticker.
+    """
+    if not tickers:
+        return {}
+    
+    yahoo_tickers = {ticker: normalize_ticker_for_yahoo(ticker) for ticker in tickers}
+    unique_yahoo = tuple(sorted(set(yahoo_tickers.values())))
+    # A failed download isn't cached, so the next refresh retries the batch
+    try:
+        year_closes = fetch_year_closes(unique_yahoo)
+    except Exception:
+        year_closes = {}
+    try:
+        recent_closes = fetch_recent_closes(unique_yahoo)
+    except Exception:
+        recent_closes = {}
+    
+    quotes = {}
+    for ticker, yahoo_ticker in yahoo_tickers.items():
+        closes = year_closes.get(yahoo_ticker)
+        recent = recent_closes.get(yahoo_ticker)
+        if closes is None or recent is None:
+            # The year's last close can be stale; fetch_stock_data below
+            # gets a current price
+            continue
+        # Fresh recent bars replace the (older) tail of the year
+        closes = pd.concat([closes[closes.index < recent.index[0]], recent])
+        data = _quote_from_closes(closes, ticker)
         if data:
-            results[ticker] = data
-        else:
-            # Try with normalized ticker if original failed
-            normalized = normalize_ticker_for_yahoo(ticker)
-            if normalized != ticker.upper():
-                data = fetch_stock_data(normalized)
+            quotes[ticker] = data
+    
+    missing = [ticker for ticker in tickers if ticker not in quotes]
+    named = [ticker for ticker in tickers if ticker in quotes] if with_names else []
+    if missing or named:
+        with ThreadPoolExecutor(max_workers=min(16, len(missing) + len(named))) as executor:
+            for ticker, data in zip(missing, executor.map(fetch_stock_data, missing)):
                 if data:
-                    results[ticker] = data
+                    quotes[ticker] = data
+            for ticker, name in zip(named, executor.map(fetch_company_name, named)):
+                quotes[ticker]["name"] = name
+    
+    results = {}
+    for ticker in tickers:
+        if ticker in quotes:
+            results[ticker] = _last_good_quotes[ticker] = quotes[ticker]
+        elif ticker in _last_good_quotes:
+            # Stale but better than dropping back to the JSON file's numbers
+            results[ticker] = _last_good_quotes[ticker]
     return results
 
 
@@ -195,30 +367,32 @@ def update_positions_with_realtime(positions: List[Dict], use_realtime: bool = T
     
     tickers = [pos["ticker"] for pos in positions]
     realtime_data = fetch_multiple_stocks(tickers)
+    return _apply_realtime_data(positions, realtime_data)
+
+
+def _apply_realtime_data(positions: List[Dict], realtime_data: Dict[str, Dict]) -> List[Dict]:
+    """Reprice positions at the latest quotes, keeping the implied share count."""
+    if not positions or not realtime_data:
+        return positions
     
-    updated_positions = []
-    for pos in positions:
-        ticker = pos["ticker"]
-        if ticker in realtime_data:
-            data = realtime_data[ticker]
-            # Calculate shares from original position
-            original_price = pos.get("current_price", 1.0)
-            if original_price > 0:
-                shares = pos["value"] / original_price
-            else:
-                shares = 0
-            
-            # Update price and return, recalculate value based on shares
-            updated_pos = pos.copy()
-            updated_pos["current_price"] = data["current_price"]
-            updated_pos["return_pct"] = data["ytd_return_pct"]
-            # Recalculate value based on shares and new price
-            updated_pos["value"] = shares * data["current_price"]
-            updated_positions.append(updated_pos)
-        else:
-            updated_positions.append(pos)
+    # JSON may store whole-dollar values as ints; keep the numeric columns float
+    df = pd.DataFrame(positions).astype({"value": float, "current_price": float, "return_pct": float})
+    quotes = pd.DataFrame.from_dict(realtime_data, orient="index")
+    # Map by ticker column rather than set_index so duplicate tickers stay valid
+    hit = df["ticker"].isin(quotes.index)
+    if not hit.any():
+        return positions
+    
+    tickers = df.loc[hit, "ticker"]
+    new_price = tickers.map(quotes["current_price"]).astype(float)
+    original_price = df.loc[hit, "current_price"].fillna(1.0)
+    # Shares implied by the stored value; zero when the stored price is unusable
+    shares = (df.loc[hit, "value"] / original_price).where(original_price > 0, 0.0)
     
-    return updated_positions
+    df.loc[hit, "current_price"] = new_price
+    df.loc[hit, "return_pct"] = tickers.map(quotes["ytd_return_pct"]).astype(float)
+    df.loc[hit, "value"] = shares * new_price
+    return df.to_dict("records")
 
 
 @st.cache_data(ttl=60, show_spinner=False)
@@ -231,7 +405,7 @@ def update_watchlist_with_realtime_cached(
         return {}
     
     tickers = list(watchlist_tickers)
-    realtime_data = fetch_multiple_stocks(tickers)
+    realtime_data = fetch_multiple_stocks(tickers, with_names=True)
     return realtime_data
 
 
@@ -260,105 +434,561 @@ def update_watchlist_with_realtime(watchlist: List[Dict], use_realtime: bool = T
     return updated_watchlist
 
 
-def _simulate_portfolio_growth_over_time_internal(
-    positions_data: List[Dict],  # Use dict representation for caching
+@st.cache_data(ttl=60, max_entries=4, show_spinner="📡 Loading watchlist...")
+def _cached_watchlist(
+    watchlist: List[Dict],
+    use_realtime: bool = True,
+) -> Tuple[List[Dict], Dict[str, WatchItem]]:
+    """Watchlist with real-time data, plus a ticker -> WatchItem map of it.
+    
+    Expires with the quotes it is built from, so prices don't go stale for
+    the rest of the session. Concurrent reruns asking for the same
+    watchlist wait for one fetch instead of each making their own.
+    """
+    updated_watchlist = update_watchlist_with_realtime(watchlist, use_realtime)
+    watch_map = {w["ticker"]: WatchItem(
+        ticker=w["ticker"],
+        name=w.get("name", w["ticker"]),
+        current_price=w["current_price"],
+        today_return_pct=w["today_return_pct"],
+        total_return_pct=w.get("total_return_pct", w.get("ytd_return_pct", 0.0)),
+    ) for w in updated_watchlist}
+    return updated_watchlist, watch_map
+
+
+# Positions and watchlist items are hashed by the fields the predictions
+# depend on, so cached analyses survive reruns that rebuild the objects
+_ANALYSIS_HASH_FUNCS = {
+    Position: lambda p: (p.ticker, p.value, p.return_pct, p.current_price),
+    WatchItem: lambda w: (w.ticker, w.current_price, w.today_return_pct, w.total_return_pct),
+}
+# Whole-portfolio results; per-position price simulations get an entry per
+# holding
+ANALYSIS_CACHE_ENTRIES = 64
+POSITION_CACHE_ENTRIES = 512
+
+
+@st.cache_data(max_entries=ANALYSIS_CACHE_ENTRIES, show_spinner=False, hash_funcs=_ANALYSIS_HASH_FUNCS)
+def analyse_portfolio_cached(
+    positions: List[Position],
     sigma: float = 0.15,
     days: int = 252,
-    n_sims: int = 100,
+    n_sims: int = 1000,
     random_seed: Optional[int] = None,
-    dca_schedule: Optional[Dict[str, Dict]] = None,
-) -> tuple:
-    """Internal simulation function that works with hashable data."""
-    # Convert dicts to Position objects
-    positions = [Position(**p) for p in positions_data]
-    
-    if random_seed is not None:
-        np.random.seed(random_seed)
-    
-    dt = 1.0 / 252.0
-    drift_constants = {}
-    diffusion_stds = {}
+) -> Dict:
+    """Cached analyse_portfolio."""
+    return analyse_portfolio(positions, sigma=sigma, days=days, n_sims=n_sims, random_seed=random_seed)
+
+
+@st.cache_data(max_entries=ANALYSIS_CACHE_ENTRIES, show_spinner=False, hash_funcs=_ANALYSIS_HASH_FUNCS)
+def analyse_portfolio_batch_cached(
+    positions: List[Position],
+    scenarios: Tuple[Tuple[float, int], ...],
+    n_sims: int = 1000,
+    random_seed: Optional[int] = None,
+) -> List[Dict]:
+    """Cached analyse_portfolio_batch."""
+    return analyse_portfolio_batch(positions, scenarios, n_sims=n_sims, random_seed=random_seed)
+
+
+@st.cache_data(max_entries=ANALYSIS_CACHE_ENTRIES, show_spinner=False, hash_funcs=_ANALYSIS_HASH_FUNCS)
+def predict_positions_batch_cached(
+    positions: List[Position],
+    sigma: float = 0.15,
+    days: int = 252,
+    n_sims: int = 1000,
+    random_seed: Optional[int] = None,
+) -> Dict[str, Dict[str, float]]:
+    """Cached predict_positions_batch."""
+    return predict_positions_batch(positions, sigma=sigma, days=days, n_sims=n_sims, random_seed=random_seed)
+
+
+@st.cache_data(max_entries=POSITION_CACHE_ENTRIES, show_spinner=False)
+def simulate_gbm_price_cached(
+    current_price: float,
+    mu: float,
+    sigma: float,
+    days: int = 252,
+    n_sims: int = 1000,
+    random_seed: Optional[int] = None,
+) -> np.ndarray:
+    """Cached simulate_gbm_price."""
+    return simulate_gbm_price(current_price, mu, sigma, days=days, n_sims=n_sims, random_seed=random_seed)
+
+
+@st.cache_data(max_entries=ANALYSIS_CACHE_ENTRIES, show_spinner=False, hash_funcs=_ANALYSIS_HASH_FUNCS)
+def analyse_watchlist_cached(
+    watchlist: List[WatchItem],
+    sigma: float = 0.15,
+    days: int = 252,
+    n_sims: int = 1000,
+    random_seed: Optional[int] = None,
+) -> List[Tuple[str, float, float]]:
+    """Cached analyse_watchlist."""
+    return analyse_watchlist(watchlist, sigma=sigma, days=days, n_sims=n_sims, random_seed=random_seed)
+
+
+# Paths per block in _gbm_paths_numpy; 64 paths x 252 days x 20 positions
+# in float32 is about 1.3 MB
+GBM_BLOCK_SIMS = 64
+
+
+def _gbm_paths_numpy(
+    drifts: np.ndarray,
+    diffusion_stds: np.ndarray,
+    start_prices: np.ndarray,
+    start_shares: np.ndarray,
+    dca_idx: np.ndarray,
+    dca_freq: np.ndarray,
+    dca_amount: np.ndarray,
+    days: int,
+    time_points: np.ndarray,
+    n_sims: int,
+    seed: int,
+    first_block: int = 0,
+) -> np.ndarray:
+    """Portfolio value at each time point for every path, as array operations.
+
+    Used when numba is not installed; see _gbm_paths_numba. drifts has one
+    row per volatility in diffusion_stds, and every volatility is driven by
+    the same normal draws, so the result has shape (n_sigmas, n_sims,
+    n_points). Works in the dtype of the input arrays, so float32 inputs
+    halve the memory traffic of the per-day (days, block, n_pos) buffers.
+
+    Block b draws from its own SFC64 generator seeded with (seed, b), the
+    fastest of NumPy's bit generators for bulk normals, and is always
+    simulated in full, so the first k blocks of a run come out the same
+    whatever n_sims is. first_block lets a caller continue an earlier run.
+    """
+    n_sigmas, n_pos = drifts.shape
+    dtype = drifts.dtype
+    out = np.empty((n_sigmas, n_sims, time_points.shape[0]), dtype=dtype)
     
-    # Pre-compute constants for each position
-    for pos in positions:
-        mu = pos.return_pct / 100.0
-        drift_constants[pos.ticker] = (mu - 0.5 * sigma ** 2) * dt
-        diffusion_stds[pos.ticker] = sigma * np.sqrt(dt)
+    # Paths are simulated GBM_BLOCK_SIMS at a time so the per-day buffers
+    # stay cache-sized however many paths are requested
+    normals = np.empty((days, GBM_BLOCK_SIMS, n_pos), dtype=dtype)
+    log_paths = np.empty((days + 1, GBM_BLOCK_SIMS, n_pos), dtype=dtype)
+    block_values = np.empty((GBM_BLOCK_SIMS, time_points.shape[0]), dtype=dtype)
+    buys_per_day = [np.arange(freq, days + 1, freq) for freq in dca_freq]
+    for first in range(0, n_sims, GBM_BLOCK_SIMS):
+        rng = np.random.Generator(np.random.SFC64([seed, first_block + first // GBM_BLOCK_SIMS]))
+        rng.standard_normal(dtype=dtype, out=normals)
+        # The last block may be partly unused
+        kept = min(GBM_BLOCK_SIMS, n_sims - first)
+        
+        for k in range(n_sigmas):
+            # log_paths[d] holds each path's cumulative log return per
+            # position at the close of day d (day 0 = today)
+            log_paths[0] = 0.0
+            np.multiply(normals, diffusion_stds[k], out=log_paths[1:])
+            log_paths[1:] += drifts[k]
+            np.cumsum(log_paths, axis=0, out=log_paths)
+            
+            # Prices are only needed on sample days and DCA buy days, so
+            # exp() is taken on those rows alone rather than on every day
+            sample_prices = start_prices * np.exp(log_paths[time_points])
+            
+            # Shares held on each sample day, per path and position
+            shares = np.broadcast_to(start_shares, sample_prices.shape).copy()
+            
+            # DCA contributions buy at the previous day's price, before that day's move
+            for idx, buy_days, amount in zip(dca_idx, buys_per_day, dca_amount):
+                if buy_days.size == 0:
+                    continue
+                buy_prices = start_prices[idx] * np.exp(log_paths[buy_days - 1, :, idx])
+                shares_added = np.divide(
+                    amount, buy_prices,
+                    out=np.zeros_like(buy_prices), where=buy_prices > 0,
+                )
+                # Running total of shares bought, with a leading 0 for "no buys yet"
+                bought = np.zeros((buy_days.size + 1, GBM_BLOCK_SIMS), dtype=dtype)
+                np.cumsum(shares_added, axis=0, out=bought[1:])
+                buys_so_far = np.searchsorted(buy_days, time_points, side='right')
+                shares[:, :, idx] += bought[buys_so_far]
+            
+            np.einsum('tbp,tbp->bt', shares, sample_prices, out=block_values)
+            out[k, first:first + kept] = block_values[:kept]
     
-    # Simulate paths over time - sample every 10 days
+    return out
+
+
+# Explicit signature: numba compiles (or loads from its on-disk cache) at
+# import instead of on the first simulation a user asks for
+GBM_NUMBA_SIGNATURE = (
+    "float32[:, :, :](float64[:, :], float64[:], float64[:], float64[:], "
+    "int64[:], int64[:], float64[:], int64, int64[:], int64, int64)"
+)
+
+if HAS_NUMBA:
+    @njit(GBM_NUMBA_SIGNATURE, parallel=True, nogil=True, fastmath=True, cache=True, boundscheck=False)
+    def _gbm_paths_numba(
+        drifts, diffusion_stds, start_prices, start_shares,
+        dca_idx, dca_freq, dca_amount, days, time_points, n_sims, seed,
+    ):
+        """Compiled equivalent of _gbm_paths_numpy, one path per thread.
+
+        Each path keeps only its running log returns and shares, so memory
+        is O(n_sims * len(time_points)) instead of O(n_sims * days * n_pos).
+        Path s is seeded with seed + s, so results don't depend on how
+        paths are spread over threads, and each normal draw moves that
+        path under every volatility at once. Each path accumulates in
+        float64; only the stored values are float32, like the NumPy path.
+        Runs without the GIL, so simulations from other sessions' script
+        threads overlap instead of queueing.
+        """
+        n_sigmas, n_pos = drifts.shape
+        n_points = time_points.shape[0]
+        out = np.empty((n_sigmas, n_sims, n_points), dtype=np.float32)
+        for s in prange(n_sims):
+            np.random.seed(seed + s)
+            cumulative = np.zeros((n_sigmas, n_pos))
+            shares = np.empty((n_sigmas, n_pos))
+            total = 0.0
+            for j in range(n_pos):
+                total += start_shares[j] * start_prices[j]
+            for k in range(n_sigmas):
+                shares[k] = start_shares
+                out[k, s, 0] = total
+            t = 1
+            for day in range(1, days + 1):
+                # DCA buys at the previous day's price, before this day's move
+                for d in range(dca_idx.shape[0]):
+                    if day % dca_freq[d] == 0:
+                        j = dca_idx[d]
+                        for k in range(n_sigmas):
+                            price = start_prices[j] * np.exp(cumulative[k, j])
+                            if price > 0:
+                                shares[k, j] += dca_amount[d] / price
+                for j in range(n_pos):
+                    z = np.random.standard_normal()
+                    for k in range(n_sigmas):
+                        cumulative[k, j] += drifts[k, j] + diffusion_stds[k] * z
+                if t < n_points and day == time_points[t]:
+                    for k in range(n_sigmas):
+                        total = 0.0
+                        for j in range(n_pos):
+                            total += shares[k, j] * start_prices[j] * np.exp(cumulative[k, j])
+                        out[k, s, t] = total
+                    t += 1
+        return out
+
+
+@st.cache_resource(show_spinner=False)
+def warm_up_numba() -> bool:
+    """Run the compiled kernel once per process on a one-position dummy.
+
+    Starts numba's thread pool before the first real simulation. Returns
+    whether numba is in use.
+    """
+    if not HAS_NUMBA:
+        return False
+    one = np.ones(1)
+    none_int = np.zeros(0, dtype=np.int64)
+    _gbm_paths_numba(
+        np.zeros((1, 1)), np.zeros(1), one, one, none_int, none_int, np.zeros(0),
+        1, np.array([0, 1], dtype=np.int64), 1, 0,
+    )
+    return True
+
+
+# One packed record per position; the simulation cache is keyed on the bytes
+POSITION_RECORD = np.dtype([
+    ('ticker', 'U16'),
+    ('value', 'f8'),
+    ('return_pct', 'f8'),
+    ('current_price', 'f8'),
+])
+
+
+def _pack_positions(positions) -> np.ndarray:
+    """Positions as one POSITION_RECORD array (passed through if already one)."""
+    if isinstance(positions, np.ndarray):
+        return positions
+    return np.array(
+        [(pos.ticker, pos.value, pos.return_pct, pos.current_price) for pos in positions],
+        dtype=POSITION_RECORD,
+    )
+
+
+# One row per ticker of a DCA schedule, for cache keys
+DCA_RECORD = np.dtype([
+    ('ticker', 'U16'),
+    ('amount', 'f8'),
+    ('frequency_days', 'i8'),
+])
+
+
+def _pack_dca_schedule(dca_schedule: Optional[Dict[str, Dict]]) -> bytes:
+    """A DCA schedule as the bytes of a ticker-sorted DCA_RECORD array (b"" if empty)."""
+    if not dca_schedule:
+        return b""
+    records = np.array(
+        [(ticker, config['amount'], config['frequency_days']) for ticker, config in dca_schedule.items()],
+        dtype=DCA_RECORD,
+    )
+    return np.sort(records, order='ticker').tobytes()
+
+
+def _digest(data: bytes) -> str:
+    """Short hex digest of data (xxh3 when xxhash is installed, blake2b otherwise)."""
+    if HAS_XXHASH:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def simulation_cache_key(
+    prefix: str,
+    positions: List[Position],
+    sigmas: Tuple[float, ...],
+    days: int,
+    n_sims: int,
+    random_seed: Optional[int],
+    dca_schedule: Optional[Dict[str, Dict]],
+) -> str:
+    """Key identifying a simulation result cached in session state.
+
+    Digests the packed positions and parameters in one pass (xxh3 when
+    xxhash is installed, blake2b otherwise) instead of hashing nested
+    tuples of Python objects.
+    """
+    key_bytes = b"".join((
+        _pack_positions(positions).tobytes(),
+        np.asarray(sigmas, dtype=np.float64).tobytes(),
+        struct.pack("<qq?q", days, n_sims, random_seed is None, random_seed or 0),
+        _pack_dca_schedule(dca_schedule),
+    ))
+    return f"{prefix}_{_digest(key_bytes)}"
+
+
+def _sample_time_points(days: int) -> np.ndarray:
+    """Days on which path values are kept: about 50 of them, always ending on days."""
     sample_interval = max(1, days // 50)  # Sample ~50 points
     time_points = list(range(0, days + 1, sample_interval))
     if time_points[-1] != days:
         time_points.append(days)
-    time_points = np.array(time_points)
+    return np.array(time_points, dtype=np.int64)
+
+
+def _simulate_portfolio_growth_multi_sigma_internal(
+    positions_data: np.ndarray,  # POSITION_RECORD array
+    sigmas: Tuple[float, ...] = (0.15,),
+    days: int = 252,
+    n_sims: int = 100,
+    random_seed: Optional[int] = None,
+    dca_schedule: Optional[Dict[str, Dict]] = None,
+    dtype: type = np.float32,
+    rng: Optional[np.random.Generator] = None,
+    first_path: int = 0,
+) -> tuple:
+    """Internal simulation function that works with hashable data.
+
+    Simulates the portfolio under each volatility in sigmas from one set of
+    normal draws and returns paths of shape (len(sigmas), n_sims, n_points).
+    Paths are simulated by a compiled numba kernel when numba is
+    installed and with NumPy array operations otherwise. dtype sets the
+    precision of the NumPy path; pass np.float64 to validate results.
+    An explicit rng takes precedence over random_seed.
+
+    Only paths first_path..n_sims are returned. For a fixed seed, path i is
+    the same in every run, whichever other sigmas it is run with, so a
+    larger run can extend a smaller one. first_path must be a multiple of
+    GBM_BLOCK_SIMS.
+    """
+    if rng is None:
+        rng = np.random.Generator(np.random.SFC64(random_seed))
+    dt = 1.0 / 252.0
     
-    portfolio_paths = np.zeros((n_sims, len(time_points)))
+    # One contiguous array per field (same maths as Position)
+    values = np.ascontiguousarray(positions_data['value'])
+    mus = positions_data['return_pct'] / 100.0
+    start_prices = np.ascontiguousarray(positions_data['current_price'])
+    start_shares = np.divide(values, start_prices, out=np.zeros_like(values), where=start_prices > 0)
+    sigmas = np.asarray(sigmas, dtype=np.float64)
+    drifts = (mus - 0.5 * sigmas[:, None] ** 2) * dt
+    diffusion_stds = sigmas * np.sqrt(dt)
     
-    # Initialize DCA tracking
+    # DCA settings as parallel arrays over the positions that have one
     dca_schedule = dca_schedule or {}
-    position_shares = {pos.ticker: pos.shares for pos in positions}
+    ticker_idx = {ticker: idx for idx, ticker in enumerate(positions_data['ticker'].tolist())}
+    dca_tickers = [
+        ticker for ticker, config in dca_schedule.items()
+        if ticker in ticker_idx and config['frequency_days'] > 0
+    ]
+    dca_idx = np.array([ticker_idx[t] for t in dca_tickers], dtype=np.int64)
+    dca_freq = np.array([dca_schedule[t]['frequency_days'] for t in dca_tickers], dtype=np.int64)
+    dca_amount = np.array([dca_schedule[t]['amount'] for t in dca_tickers], dtype=np.float64)
     
-    for sim_idx in range(n_sims):
-        portfolio_value_over_time = []
-        current_total = sum(pos.value for pos in positions)
-        portfolio_value_over_time.append(current_total)
-        
-        # Track cumulative log returns and shares for each position
-        cumulative_log_returns = {pos.ticker: 0.0 for pos in positions}
-        current_shares = position_shares.copy()
-        
-        for day in range(1, days + 1):
-            total_value = 0.0
-            
-            # Process DCA contributions
-            for ticker, dca_config in dca_schedule.items():
-                if day % dca_config['frequency_days'] == 0:
-                    # Find the position
-                    pos = next((p for p in positions if p.ticker == ticker), None)
-                    if pos:
-                        # Calculate current price
-                        current_price = pos.current_price * np.exp(cumulative_log_returns[ticker])
-                        # Buy shares with DCA amount
-                        dca_amount = dca_config['amount']
-                        shares_to_add = dca_amount / current_price if current_price > 0 else 0
-                        current_shares[ticker] += shares_to_add
-            
-            # Calculate portfolio value
-            for pos in positions:
-                # Generate daily random increment
-                increment = np.random.normal(loc=0.0, scale=1.0)
-                daily_log_return = drift_constants[pos.ticker] + diffusion_stds[pos.ticker] * increment
-                cumulative_log_returns[pos.ticker] += daily_log_return
-                
-                # Calculate price at this day
-                price = pos.current_price * np.exp(cumulative_log_returns[pos.ticker])
-                shares = current_shares[pos.ticker]
-                total_value += shares * price
-            
-            # Store value if this is a sample point
-            if day in time_points[1:]:
-                portfolio_value_over_time.append(total_value)
-        
-        portfolio_paths[sim_idx] = portfolio_value_over_time
+    time_points = _sample_time_points(days)
+    
+    seed = int(rng.integers(2 ** 31))
+    n_new = n_sims - first_path
+    if HAS_NUMBA:
+        # Path s is seeded with seed + s, so offset the seed to continue
+        portfolio_paths = _gbm_paths_numba(
+            drifts, diffusion_stds, start_prices, start_shares,
+            dca_idx, dca_freq, dca_amount, int(days), time_points, int(n_new),
+            seed + first_path,
+        )
+    else:
+        portfolio_paths = _gbm_paths_numpy(
+            drifts.astype(dtype), diffusion_stds.astype(dtype), start_prices.astype(dtype),
+            start_shares.astype(dtype), dca_idx, dca_freq, dca_amount.astype(dtype),
+            days, time_points, n_new, seed, first_path // GBM_BLOCK_SIMS,
+        )
+    portfolio_paths[:, :, 0] = values.sum()
     
     return portfolio_paths, time_points
 
 
-@st.cache_data(ttl=3600, show_spinner=False)  # Cache for 1 hour - simulations are expensive
-def simulate_portfolio_growth_over_time_cached(
-    positions_data: Tuple[Dict],  # Tuple of dicts for hashability
+def _simulate_portfolio_growth_over_time_internal(
+    positions_data: np.ndarray,  # POSITION_RECORD array
     sigma: float = 0.15,
     days: int = 252,
     n_sims: int = 100,
     random_seed: Optional[int] = None,
-    dca_schedule: Optional[Tuple] = None,  # Tuple for hashability
+    dca_schedule: Optional[Dict[str, Dict]] = None,
+    **kwargs,
 ) -> tuple:
-    """Cached wrapper for simulation."""
-    positions_list = list(positions_data)
-    dca_dict = dict(dca_schedule) if dca_schedule else None
-    return _simulate_portfolio_growth_over_time_internal(
-        positions_list, sigma, days, n_sims, random_seed, dca_dict
+    """Single-volatility form of _simulate_portfolio_growth_multi_sigma_internal."""
+    portfolio_paths, time_points = _simulate_portfolio_growth_multi_sigma_internal(
+        positions_data, (sigma,), days, n_sims, random_seed, dca_schedule, **kwargs
     )
+    return portfolio_paths[0], time_points
+
+
+# Paths simulated per step when a run is written to its spill file; a
+# multiple of GBM_BLOCK_SIMS, and 4096 paths x 3 sigmas x 51 points in
+# float32 is about 2.5 MB
+SIM_CHUNK_PATHS = 4096
+
+
+def _simulate_growth_chunks(
+    positions_data: np.ndarray,  # POSITION_RECORD array
+    sigmas: Tuple[float, ...],
+    days: int,
+    n_sims: int,
+    random_seed: Optional[int] = None,
+    dca_schedule: Optional[Dict[str, Dict]] = None,
+    first_path: int = 0,
+    chunk: int = SIM_CHUNK_PATHS,
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """Yield (start, paths) for paths first_path..n_sims, chunk paths at a time.
+
+    Every block of paths is seeded on its own, so the chunks together equal
+    one _simulate_portfolio_growth_multi_sigma_internal call over the whole
+    range; only one chunk is held in memory at a time.
+    """
+    if random_seed is None:
+        # One seed for all chunks, or they would draw overlapping streams
+        random_seed = np.random.SeedSequence().entropy
+    for start in range(first_path, n_sims, chunk):
+        paths, _ = _simulate_portfolio_growth_multi_sigma_internal(
+            positions_data, sigmas, days, min(start + chunk, n_sims), random_seed,
+            dca_schedule, first_path=start,
+        )
+        yield start, paths
+
+
+# Simulation runs kept per session for extending when n_sims grows
+MC_CACHE_ENTRIES = 8
+
+
+@st.cache_resource(show_spinner=False)
+def _paths_spill_dir() -> str:
+    """Per-process temp directory for spilled simulation paths, removed at exit."""
+    path = tempfile.mkdtemp(prefix="pfsim_")
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+
+def _spill_paths(shape: Tuple[int, ...], chunks: Iterable[Tuple[int, np.ndarray]]) -> np.memmap:
+    """Write path chunks to a temp .npy file and return it memory-mapped read-only.
+    
+    chunks yields (start, paths) slices along axis 1 of the full shape, so a
+    run never has to be held in memory as a whole. Session-cached runs then
+    live in the OS page cache instead of each session's heap.
+    """
+    with tempfile.NamedTemporaryFile(dir=_paths_spill_dir(), suffix=".npy", delete=False) as f:
+        pass
+    out = np.lib.format.open_memmap(f.name, mode="w+", dtype=np.float32, shape=shape)
+    for start, paths in chunks:
+        out[:, start:start + paths.shape[1]] = paths
+    out.flush()
+    del out
+    paths = np.load(f.name, mmap_mode="r")
+    # Delete the file once nothing maps it: every slice of a run (mc_cache,
+    # each Tab 1 view's latest run) holds the mmap, so this fires once the
+    # run is evicted from mc_cache and no view shows it any more, or when the
+    # session ends. The hook sits on the mmap itself, which is unmapped
+    # before it fires, so the removal also works on Windows. Files still
+    # mapped at exit are left to the directory's atexit cleanup
+    weakref.finalize(paths._mmap, _remove_spilled, f.name).atexit = False
+    return paths
+
+
+def _remove_spilled(filename: str) -> None:
+    """Delete a spilled paths file that is no longer mapped."""
+    try:
+        os.remove(filename)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning("Could not remove spilled simulation paths %s: %s", filename, e)
+
+
+def simulate_portfolio_growth_multi_sigma(
+    positions: List[Position],
+    sigmas: Tuple[float, ...] = (0.15,),
+    days: int = 252,
+    n_sims: int = 100,
+    random_seed: Optional[int] = None,
+    dca_schedule: Optional[Dict[str, Dict]] = None,
+) -> tuple:
+    """Simulate portfolio value over time under several volatilities at once.
+
+    Returns paths of shape (len(sigmas), n_sims, n_points) and the time
+    points. All volatilities share one set of random draws, so the
+    scenarios differ only in sigma. positions may also be given as a
+    POSITION_RECORD array.
+    """
+    # Pack into bytes so the cache key is hashed in one pass
+    positions_data = _pack_positions(positions)
+    
+    sigmas = tuple(float(s) for s in sigmas)
+    positions_bytes = positions_data.tobytes()
+    
+    # Reuse the largest run for these inputs: fewer paths is a slice, more
+    # paths only simulates the blocks past the last complete one
+    mc_cache = st.session_state.setdefault("mc_cache", {})
+    key = (positions_bytes, sigmas, days, random_seed, _pack_dca_schedule(dca_schedule))
+    done = mc_cache.pop(key, None)
+    if done is not None and done[0].shape[1] >= n_sims:
+        mc_cache[key] = done
+        return done[0][:, :n_sims], done[1]
+    
+    first_path = 0
+    if done is not None:
+        first_path = done[0].shape[1] - done[0].shape[1] % GBM_BLOCK_SIMS
+    time_points = _sample_time_points(days)
+    # Copy the reused paths and simulate the rest a chunk at a time, straight
+    # into the new run's file
+    chunks = _simulate_growth_chunks(
+        positions_data, sigmas, days, n_sims, random_seed, dca_schedule, first_path
+    )
+    if first_path:
+        reused = (
+            (start, done[0][:, start:min(start + SIM_CHUNK_PATHS, first_path)])
+            for start in range(0, first_path, SIM_CHUNK_PATHS)
+        )
+        chunks = itertools.chain(reused, chunks)
+    portfolio_paths = _spill_paths((len(sigmas), n_sims, time_points.shape[0]), chunks)
+    
+    # Replaced and evicted runs delete their files once their last slice is
+    # dropped (see _spill_paths)
+    mc_cache[key] = (portfolio_paths, time_points)
+    while len(mc_cache) > MC_CACHE_ENTRIES:
+        mc_cache.pop(next(iter(mc_cache)))
+    return portfolio_paths, time_points
 
 
 def simulate_portfolio_growth_over_time(
@@ -370,21 +1000,63 @@ def simulate_portfolio_growth_over_time(
     dca_schedule: Optional[Dict[str, Dict]] = None,
 ) -> tuple:
     """Simulate portfolio value over time for multiple paths (with caching)."""
-    # Convert to hashable format for caching
-    positions_data = tuple({
-        'ticker': pos.ticker,
-        'value': pos.value,
-        'return_pct': pos.return_pct,
-        'current_price': pos.current_price,
-    } for pos in positions)
-    
-    dca_tuple = tuple(sorted(dca_schedule.items())) if dca_schedule else None
-    
-    return simulate_portfolio_growth_over_time_cached(
-        positions_data, sigma, days, n_sims, random_seed, dca_tuple
+    portfolio_paths, time_points = simulate_portfolio_growth_multi_sigma(
+        positions, (sigma,), days, n_sims, random_seed, dca_schedule
     )
+    return portfolio_paths[0], time_points
+
+
+def _quantiles(values: np.ndarray, qs: Tuple[float, ...] = (0.05, 0.5, 0.95)) -> np.ndarray:
+    """Quantiles of a 1-D array from a single partition.
+    
+    Interpolates linearly between order statistics, like np.percentile,
+    but partitions once for all of qs instead of once per call.
+    """
+    ranks = np.asarray(qs) * (len(values) - 1)
+    lower = np.floor(ranks).astype(np.intp)
+    upper = np.ceil(ranks).astype(np.intp)
+    ordered = np.partition(values, np.union1d(lower, upper))
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (ranks - lower)
+
+
+def _band_polygon(
+    lower: np.ndarray,
+    upper: np.ndarray,
+    time_points: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Outline of a shaded band: along the upper edge, back along the lower.
+    
+    Values are rounded to cents, which is all the chart shows and keeps the
+    figure JSON sent to the browser small.
+    """
+    xs = np.concatenate([time_points, time_points[::-1]])
+    ys = np.round(np.concatenate([upper, lower[::-1]]), 2)
+    return xs, ys
+
+
+def _hex_to_rgb(color: str) -> Tuple[int, int, int]:
+    """'#rrggbb' -> (r, g, b)."""
+    return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+
+
+# Default scenario colours, parsed once
+SCENARIO_COLORS = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6', '#1abc9c']
+SCENARIO_COLORS_RGB = [_hex_to_rgb(c) for c in SCENARIO_COLORS]
+
 
+def _hash_array(a: np.ndarray) -> tuple:
+    """Chart cache hash of a full array (streamlit's default samples large ones)."""
+    return a.shape, a.dtype.str, _digest(a.tobytes())
 
+
+# Figures are memoized on the array digest. hash_funcs match exact types, and
+# session-cached paths are memmaps. Only the current views' figures are worth
+# keeping.
+_ARRAY_HASH_FUNCS = {np.ndarray: _hash_array, np.memmap: _hash_array}
+CHART_CACHE_ENTRIES = 8
+
+
+@st.cache_resource(max_entries=CHART_CACHE_ENTRIES, show_spinner=False, hash_funcs=_ARRAY_HASH_FUNCS)
 def create_portfolio_growth_chart(
     portfolio_paths: np.ndarray,
     time_points: np.ndarray,
@@ -395,20 +1067,19 @@ def create_portfolio_growth_chart(
     """Create an interactive chart showing portfolio growth over time."""
     fig = go.Figure()
     
-    # Calculate percentiles for confidence bands
-    p5_values = np.percentile(portfolio_paths, 5, axis=0)
-    p25_values = np.percentile(portfolio_paths, 25, axis=0)
-    p75_values = np.percentile(portfolio_paths, 75, axis=0)
-    p95_values = np.percentile(portfolio_paths, 95, axis=0)
-    median_values = np.percentile(portfolio_paths, 50, axis=0)
+    # Calculate percentiles for confidence bands (one partition for all five)
+    p5_values, p25_values, median_values, p75_values, p95_values = np.percentile(
+        portfolio_paths, [5, 25, 50, 75, 95], axis=0
+    )
     
     # Convert hex color to RGB for better visibility
-    r, g, b = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+    r, g, b = _hex_to_rgb(color)
     
     # Add 95% confidence band (5th to 95th percentile) - lightest shade
+    band_x, band_y = _band_polygon(p5_values, p95_values, time_points)
     fig.add_trace(go.Scatter(
-        x=np.concatenate([time_points, time_points[::-1]]),
-        y=np.concatenate([p95_values, p5_values[::-1]]),
+        x=band_x,
+        y=band_y,
         fill='toself',
         fillcolor=f'rgba({r}, {g}, {b}, 0.15)',
         line=dict(color='rgba(255,255,255,0)'),
@@ -418,9 +1089,10 @@ def create_portfolio_growth_chart(
     ))
     
     # Add 50% confidence band (25th to 75th percentile) - medium shade
+    band_x, band_y = _band_polygon(p25_values, p75_values, time_points)
     fig.add_trace(go.Scatter(
-        x=np.concatenate([time_points, time_points[::-1]]),
-        y=np.concatenate([p75_values, p25_values[::-1]]),
+        x=band_x,
+        y=band_y,
         fill='toself',
         fillcolor=f'rgba({r}, {g}, {b}, 0.3)',
         line=dict(color='rgba(255,255,255,0)'),
@@ -433,7 +1105,7 @@ def create_portfolio_growth_chart(
     darker_color = f'rgb({max(0, r-30)}, {max(0, g-30)}, {max(0, b-30)})'
     fig.add_trace(go.Scatter(
         x=time_points,
-        y=median_values,
+        y=np.round(median_values, 2),
         mode='lines',
         name=f'{scenario_name} - Expected',
         line=dict(color=darker_color, width=4),
@@ -516,6 +1188,7 @@ def create_portfolio_growth_chart(
     return fig
 
 
+@st.cache_resource(max_entries=CHART_CACHE_ENTRIES, show_spinner=False, hash_funcs=_ARRAY_HASH_FUNCS)
 def create_multi_scenario_growth_chart(
     scenarios: Dict[str, tuple],  # Dict of scenario_name: (portfolio_paths, time_points, current_value, color)
     base_current_value: float,
@@ -523,22 +1196,22 @@ def create_multi_scenario_growth_chart(
     """Create a chart comparing multiple portfolio scenarios."""
     fig = go.Figure()
     
-    colors = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6', '#1abc9c']
-    
     for idx, (scenario_name, (portfolio_paths, time_points, current_value, scenario_color)) in enumerate(scenarios.items()):
-        color = scenario_color if scenario_color else colors[idx % len(colors)]
+        if scenario_color:
+            r, g, b = _hex_to_rgb(scenario_color)
+        else:
+            r, g, b = SCENARIO_COLORS_RGB[idx % len(SCENARIO_COLORS_RGB)]
         
         # Calculate median and confidence bands
-        median_values = np.percentile(portfolio_paths, 50, axis=0)
-        p5_values = np.percentile(portfolio_paths, 5, axis=0)
-        p95_values = np.percentile(portfolio_paths, 95, axis=0)
+        p5_values, median_values, p95_values = np.percentile(portfolio_paths, [5, 50, 95], axis=0)
         
         # Add confidence band
+        band_x, band_y = _band_polygon(p5_values, p95_values, time_points)
         fig.add_trace(go.Scatter(
-            x=np.concatenate([time_points, time_points[::-1]]),
-            y=np.concatenate([p95_values, p5_values[::-1]]),
+            x=band_x,
+            y=band_y,
             fill='toself',
-            fillcolor=f'rgba({int(color[1:3], 16)}, {int(color[3:5], 16)}, {int(color[5:7], 16)}, 0.15)',
+            fillcolor=f'rgba({r}, {g}, {b}, 0.15)',
             line=dict(color='rgba(255,255,255,0)'),
             name=f'{scenario_name} - Range',
             showlegend=False,
@@ -546,11 +1219,10 @@ def create_multi_scenario_growth_chart(
         ))
         
         # Add median line - use darker color for visibility
-        r, g, b = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
         darker_color = f'rgb({max(0, r-40)}, {max(0, g-40)}, {max(0, b-40)})'
         fig.add_trace(go.Scatter(
             x=time_points,
-            y=median_values,
+            y=np.round(median_values, 2),
             mode='lines',
             name=scenario_name,
             line=dict(color=darker_color, width=4),
@@ -681,9 +1353,113 @@ def create_prediction_comparison_chart(
     return fig
 
 
+def _whatif_from_positions(positions: List[Position]) -> Dict[str, np.ndarray]:
+    """What-if portfolio as one array per field, seeded from positions."""
+    return {
+        'tickers': np.array([pos.ticker for pos in positions], dtype=object),
+        'shares': np.array([pos.shares for pos in positions], dtype=np.float64),
+        'values': np.array([pos.value for pos in positions], dtype=np.float64),
+        'returns': np.array([pos.return_pct for pos in positions], dtype=np.float64),
+        'prices': np.array([pos.current_price for pos in positions], dtype=np.float64),
+    }
+
+
+def _whatif_records(whatif: Dict[str, np.ndarray]) -> np.ndarray:
+    """What-if columns as the POSITION_RECORD array the simulation takes."""
+    records = np.empty(len(whatif['tickers']), dtype=POSITION_RECORD)
+    records['ticker'] = whatif['tickers']
+    records['value'] = whatif['values']
+    records['return_pct'] = whatif['returns']
+    records['current_price'] = whatif['prices']
+    return records
+
+
+# Button callbacks. They run before the script does, so the click's own rerun
+# already renders the new state and no extra st.rerun() is needed.
+
+def _add_dca_config(ticker: str) -> None:
+    """Append a default DCA plan for ticker."""
+    st.session_state.dca_configs.append({
+        'ticker': ticker,
+        'amount': 100.0,
+        'frequency_days': 30
+    })
+
+
+def _remove_dca_config(idx: int) -> None:
+    """Remove DCA plan idx and reset the row widgets that shift up into it."""
+    configs = st.session_state.dca_configs
+    configs.pop(idx)
+    for row in range(idx, len(configs) + 1):
+        for field in ("ticker", "amount", "freq"):
+            st.session_state.pop(f"dca_{field}_{row}", None)
+
+
+def _add_whatif_positions(watch_map: Dict[str, WatchItem]) -> None:
+    """Add the tickers selected in the Add Positions panel to the what-if columns."""
+    state = st.session_state
+    whatif = state.whatif
+    allocation_method = state.whatif_allocation_method
+    use_watchlist_return = state.whatif_use_return
+    enable_dca_new = state.whatif_enable_dca_new
+    ticker_to_idx = {ticker: idx for idx, ticker in enumerate(whatif['tickers'])}
+    
+    for ticker in state.whatif_ticker_select:
+        watch_item = watch_map.get(ticker)
+        if not watch_item:
+            continue
+        
+        # Determine return
+        if use_watchlist_return and watch_item.total_return_pct is not None:
+            return_pct = watch_item.total_return_pct
+        elif use_watchlist_return:
+            return_pct = watch_item.today_return_pct * 252
+        else:
+            return_pct = state.get("whatif_manual_return", 0.0)
+        
+        # Calculate shares and value. Only the chosen method's input is
+        # rendered, so read it with a zero fallback.
+        if allocation_method == ALLOC_DOLLARS:
+            position_value = state.get("whatif_allocation_value", 0.0)
+            shares = position_value / watch_item.current_price if watch_item.current_price > 0 else 0
+        else:
+            shares = state.get("whatif_shares_value", 0.0)
+            position_value = shares * watch_item.current_price
+        
+        # Check if exists
+        existing_idx = ticker_to_idx.get(ticker)
+        if existing_idx is not None:
+            # Add to existing
+            whatif['shares'][existing_idx] += shares
+            whatif['values'][existing_idx] += position_value
+        else:
+            # Add new
+            new_row = {
+                'tickers': ticker,
+                'shares': shares,
+                'values': position_value,
+                'returns': return_pct,
+                'prices': watch_item.current_price,
+            }
+            for column, value in new_row.items():
+                whatif[column] = np.append(whatif[column], value)
+            ticker_to_idx[ticker] = len(whatif['tickers']) - 1
+        
+        # Add DCA if enabled
+        if enable_dca_new and state.whatif_dca_amount_new > 0:
+            state.whatif_dca_schedule[ticker] = {
+                'amount': state.whatif_dca_amount_new,
+                'frequency_days': state.whatif_dca_freq_new
+            }
+    
+    # Rebuild the grid from the updated columns
+    state.whatif_version += 1
+
+
 def main():
     st.title("📈 Interactive Portfolio Analysis Dashboard")
     st.markdown("---")
+    warm_up_numba()
     
     # Sidebar for inputs
     with st.sidebar:
@@ -737,15 +1513,14 @@ def main():
         
         if st.button("🔄 Refresh Data", help="Refresh real-time data from Yahoo Finance"):
             st.cache_data.clear()
-            # Clear watchlist cache in session state
-            keys_to_remove = [k for k in st.session_state.keys() if k.startswith('watchlist_')]
-            for key in keys_to_remove:
-                del st.session_state[key]
+            session = get_yahoo_session()
+            if session is not None:
+                session.cache.clear()
             st.rerun()
         
         # Show data status
         if use_realtime:
-            st.info("📡 Using real-time data from Yahoo Finance (cached for 60 seconds)")
+            st.info("📡 Using real-time data from Yahoo Finance (prices cached for 30 seconds)")
         else:
             st.info("📄 Using data from portfolio_data.json file")
         
@@ -840,29 +1615,34 @@ def main():
         if failed_tickers:
             st.warning(f"⚠️ Could not fetch real-time data for: {', '.join(failed_tickers)}. Using JSON data for these tickers.")
         
-        # Update positions efficiently
-        updated_positions = []
-        for pos in st.session_state.positions:
-            ticker = pos["ticker"]
-            if ticker in realtime_data:
-                data = realtime_data[ticker]
-                original_price = pos.get("current_price", 1.0)
-                if original_price > 0:
-                    shares = pos["value"] / original_price
-                else:
-                    shares = 0
-                updated_pos = pos.copy()
-                updated_pos["current_price"] = data["current_price"]
-                updated_pos["return_pct"] = data["ytd_return_pct"]
-                updated_pos["value"] = shares * data["current_price"]
-                updated_positions.append(updated_pos)
-            else:
-                updated_positions.append(pos)
+        # Only rebuild when the positions or the quotes actually changed;
+        # reruns from simulation controls reuse the last result.
+        # cache_data hands back a fresh copy each call, so key on content.
+        positions_key = (
+            tuple((p["ticker"], p["value"], p["current_price"], p["return_pct"])
+                  for p in st.session_state.positions),
+            tuple(sorted((t, d["current_price"], d["ytd_return_pct"])
+                         for t, d in realtime_data.items())),
+        )
+        if st.session_state.get("positions_key") == positions_key:
+            updated_positions = st.session_state["positions_cached"]
+        else:
+            updated_positions = _apply_realtime_data(st.session_state.positions, realtime_data)
+            st.session_state["positions_cached"] = updated_positions
+            st.session_state["positions_key"] = positions_key
     else:
         updated_positions = st.session_state.positions
     
-    # Convert to Position objects
-    positions = [Position(**p) for p in updated_positions]
+    # Convert to Position objects, and pack them for the simulation cache
+    # keys and the simulations, only when the rows changed since last run
+    position_rows = tuple(
+        (p["ticker"], p["value"], p["return_pct"], p["current_price"]) for p in updated_positions
+    )
+    if st.session_state.get("position_rows") != position_rows:
+        built_positions = [Position(*row) for row in position_rows]
+        st.session_state["position_objects"] = (built_positions, _pack_positions(built_positions))
+        st.session_state["position_rows"] = position_rows
+    positions, position_records = st.session_state["position_objects"]
     
     # DCA (Dollar Cost Averaging) Configuration - moved after positions are defined
     with st.sidebar:
@@ -906,9 +1686,7 @@ def main():
                 
                 col1, col2 = st.columns([1, 4])
                 with col1:
-                    if st.button("Remove", key=f"dca_remove_{idx}"):
-                        st.session_state.dca_configs.pop(idx)
-                        st.rerun()
+                    st.button("Remove", key=f"dca_remove_{idx}", on_click=_remove_dca_config, args=(idx,))
                 
                 st.session_state.dca_configs[idx] = {
                     'ticker': ticker,
@@ -917,55 +1695,37 @@ def main():
                 }
             
             # Add new DCA plan
-            if st.button("➕ Add DCA Plan"):
-                st.session_state.dca_configs.append({
-                    'ticker': ticker_options[0] if ticker_options else '',
-                    'amount': 100.0,
-                    'frequency_days': 30
-                })
-                st.rerun()
+            st.button(
+                "➕ Add DCA Plan",
+                on_click=_add_dca_config,
+                args=(ticker_options[0] if ticker_options else '',),
+            )
     
     # Calculate current portfolio summary
     summary = portfolio_summary(positions)
     current_value = summary["total_value"]
     weighted_return = summary["weighted_return_pct"]
     
-    # Display key metrics
-    col1, col2, col3, col4 = st.columns(4)
+    # Display key metrics; the predicted ones are filled in by the Single
+    # Portfolio view, the only view that runs analyse_portfolio
+    col1, col2, predicted_col, gain_col = st.columns(4)
     with col1:
         st.metric("Total Portfolio Value", f"${current_value:,.2f}")
     with col2:
         st.metric("Weighted Return", f"{weighted_return:.2f}%")
     
-    # Run analysis
-    analysis = analyse_portfolio(
-        positions,
-        sigma=sigma,
-        days=days,
-        n_sims=n_sims,
-        random_seed=random_seed,
-    )
-    
-    with col3:
-        st.metric(
-            "Predicted Value",
-            f"${analysis['predicted_portfolio_value']:,.2f}",
-            delta=f"{analysis['predicted_portfolio_return_pct']:.2f}%"
-        )
-    with col4:
-        expected_gain = analysis['predicted_portfolio_value'] - current_value
-        st.metric("Expected Gain", f"${expected_gain:,.2f}")
-    
     st.markdown("---")
     
-    # Tabs for different views
+    # Tabs for different views. They track the selected tab (switching
+    # reruns the app), so tabs 2-5 only run while open; Growth Over Time
+    # always runs so its view mode and What-If widgets keep their state
     tab1, tab2, tab3, tab4, tab5 = st.tabs([
         "📊 Growth Over Time",
         "🔮 Prediction Scenarios",
         "📋 Position Details",
         "📈 Individual Predictions",
         "👀 Watchlist"
-    ])
+    ], key="active_tab", on_change="rerun")
     
     with tab1:
         st.header("📊 Portfolio Growth Predictions Over Time")
@@ -1006,9 +1766,11 @@ def main():
         with col2:
             show_explanation = st.checkbox("Show Detailed Stats", value=True)
         
-        # Get DCA schedule from session state
-        dca_schedule = {}
-        if 'dca_configs' in st.session_state and st.session_state.dca_configs:
+        # Get DCA schedule from session state; None (no contributions) unless
+        # DCA is enabled, even if plans are still configured
+        dca_schedule = None
+        if enable_dca and st.session_state.get('dca_configs'):
+            dca_schedule = {}
             for dca in st.session_state.dca_configs:
                 if dca.get('ticker') and dca.get('amount', 0) > 0:
                     dca_schedule[dca['ticker']] = {
@@ -1023,19 +1785,21 @@ def main():
                 st.caption(f"  • {ticker}: ${config['amount']:.2f} every {config['frequency_days']} days")
         
         # Simulate base portfolio with loading indicator
-        # Check if we have cached results first
-        positions_tuple = tuple((p.ticker, p.value, p.return_pct, p.current_price) for p in positions)
-        dca_tuple = tuple(sorted(dca_schedule.items())) if dca_schedule else None
-        cache_hash = hash((positions_tuple, sigma, days, n_sims, random_seed, dca_tuple))
-        cache_key = f"base_sim_{cache_hash}"
+        # Check if we have cached results first. Each view keeps only its
+        # latest run, so a replaced run's spilled paths are released once
+        # mc_cache evicts it too
+        cache_key = simulation_cache_key(
+            "base_sim", position_records, (sigma,), days, n_sims, random_seed, dca_schedule
+        )
+        cached = st.session_state.get("base_sim")
         
-        if cache_key in st.session_state:
-            base_portfolio_paths, time_points = st.session_state[cache_key]
+        if cached is not None and cached[0] == cache_key:
+            base_portfolio_paths, time_points = cached[1]
         else:
             with st.status("🔄 Running simulations... Please wait.", expanded=True) as status:
                 status.update(label="🔄 Running simulations... This may take a moment.", state="running")
                 base_portfolio_paths, time_points = simulate_portfolio_growth_over_time(
-                    positions,
+                    position_records,
                     sigma=sigma,
                     days=days,
                     n_sims=n_sims,
@@ -1044,9 +1808,26 @@ def main():
                 )
                 status.update(label="✅ Simulations complete!", state="complete")
                 # Cache the result
-                st.session_state[cache_key] = (base_portfolio_paths, time_points)
+                st.session_state["base_sim"] = (cache_key, (base_portfolio_paths, time_points))
         
         if view_mode == "Single Portfolio":
+            analysis = analyse_portfolio_cached(
+                positions,
+                sigma=sigma,
+                days=days,
+                n_sims=n_sims,
+                random_seed=random_seed,
+            )
+            with predicted_col:
+                st.metric(
+                    "Predicted Value",
+                    f"${analysis['predicted_portfolio_value']:,.2f}",
+                    delta=f"{analysis['predicted_portfolio_return_pct']:.2f}%"
+                )
+            with gain_col:
+                expected_gain = analysis['predicted_portfolio_value'] - current_value
+                st.metric("Expected Gain", f"${expected_gain:,.2f}")
+            
             # Single portfolio view with enhanced chart
             growth_chart = create_portfolio_growth_chart(
                 base_portfolio_paths,
@@ -1058,17 +1839,17 @@ def main():
             st.plotly_chart(growth_chart, width='stretch', key='growth_chart')
             
             if show_explanation:
-                final_values = base_portfolio_paths[:, -1]
+                worst_final, median_final, best_final = _quantiles(base_portfolio_paths[:, -1])
                 st.subheader("📈 Projection Statistics")
                 col1, col2, col3, col4 = st.columns(4)
                 with col1:
-                    st.metric("Expected Final Value", f"${np.median(final_values):,.2f}")
+                    st.metric("Expected Final Value", f"${median_final:,.2f}")
                 with col2:
-                    st.metric("Best Case (95th %ile)", f"${np.percentile(final_values, 95):,.2f}")
+                    st.metric("Best Case (95th %ile)", f"${best_final:,.2f}")
                 with col3:
-                    st.metric("Worst Case (5th %ile)", f"${np.percentile(final_values, 5):,.2f}")
+                    st.metric("Worst Case (5th %ile)", f"${worst_final:,.2f}")
                 with col4:
-                    expected_return = (np.median(final_values) / current_value - 1) * 100
+                    expected_return = (median_final / current_value - 1) * 100
                     st.metric("Expected Return", f"{expected_return:.2f}%")
         
         elif view_mode == "Compare Scenarios":
@@ -1077,24 +1858,26 @@ def main():
             
             scenarios_to_compare = {}
             
-            # Check cache for scenario simulations
-            positions_tuple = tuple((p.ticker, p.value, p.return_pct, p.current_price) for p in positions)
-            dca_tuple = tuple(sorted(dca_schedule.items())) if dca_schedule else None
-            conservative_hash = hash((positions_tuple, 0.10, days, n_sims, random_seed, dca_tuple))
-            aggressive_hash = hash((positions_tuple, 0.25, days, n_sims, random_seed, dca_tuple))
-            conservative_cache_key = f"conservative_sim_{conservative_hash}"
-            aggressive_cache_key = f"aggressive_sim_{aggressive_hash}"
+            # Check cache for scenario simulations. The moderate scenario is
+            # the base run; the other two share one multi-volatility run.
+            scenario_sigmas = (0.10, 0.25)
+            scenarios_cache_key = simulation_cache_key(
+                "scenario_sims", position_records, scenario_sigmas, days, n_sims, random_seed, dca_schedule
+            )
+            cached = st.session_state.get("scenario_sims")
             
             with st.status("🔄 Loading scenario comparisons...", expanded=False) as status:
-                if conservative_cache_key in st.session_state:
-                    status.update(label="✅ Using cached conservative scenario", state="complete")
-                    conservative_paths, _ = st.session_state[conservative_cache_key]
+                if cached is not None and cached[0] == scenarios_cache_key:
+                    status.update(label="✅ Using cached scenarios", state="complete")
+                    scenario_paths = cached[1]
                 else:
-                    status.update(label="🔄 Running conservative scenario...", state="running")
-                    conservative_paths, _ = simulate_portfolio_growth_over_time(
-                        positions, sigma=0.10, days=days, n_sims=n_sims, random_seed=random_seed, dca_schedule=dca_schedule
+                    status.update(label="🔄 Running conservative and aggressive scenarios...", state="running")
+                    scenario_paths, _ = simulate_portfolio_growth_multi_sigma(
+                        position_records, sigmas=scenario_sigmas, days=days, n_sims=n_sims,
+                        random_seed=random_seed, dca_schedule=dca_schedule,
                     )
-                    st.session_state[conservative_cache_key] = (conservative_paths, time_points)
+                    st.session_state["scenario_sims"] = (scenarios_cache_key, scenario_paths)
+                conservative_paths, aggressive_paths = scenario_paths
                 
                 scenarios_to_compare["Conservative (Low Volatility)"] = (
                     conservative_paths, time_points, current_value, "#2ecc71"
@@ -1105,16 +1888,6 @@ def main():
                     base_portfolio_paths, time_points, current_value, "#3498db"
                 )
                 
-                if aggressive_cache_key in st.session_state:
-                    status.update(label="✅ Using cached aggressive scenario", state="complete")
-                    aggressive_paths, _ = st.session_state[aggressive_cache_key]
-                else:
-                    status.update(label="🔄 Running aggressive scenario...", state="running")
-                    aggressive_paths, _ = simulate_portfolio_growth_over_time(
-                        positions, sigma=0.25, days=days, n_sims=n_sims, random_seed=random_seed, dca_schedule=dca_schedule
-                    )
-                    st.session_state[aggressive_cache_key] = (aggressive_paths, time_points)
-                
                 scenarios_to_compare["Aggressive (High Volatility)"] = (
                     aggressive_paths, time_points, current_value, "#e74c3c"
                 )
@@ -1131,13 +1904,13 @@ def main():
                 st.subheader("📊 Scenario Comparison")
                 scenario_stats = []
                 for name, (paths, _, _, _) in scenarios_to_compare.items():
-                    final_vals = paths[:, -1]
+                    worst_final, median_final, best_final = _quantiles(paths[:, -1])
                     scenario_stats.append({
                         "Scenario": name,
-                        "Expected Value": f"${np.median(final_vals):,.2f}",
-                        "Best Case": f"${np.percentile(final_vals, 95):,.2f}",
-                        "Worst Case": f"${np.percentile(final_vals, 5):,.2f}",
-                        "Expected Return": f"{((np.median(final_vals) / current_value - 1) * 100):.2f}%",
+                        "Expected Value": f"${median_final:,.2f}",
+                        "Best Case": f"${best_final:,.2f}",
+                        "Worst Case": f"${worst_final:,.2f}",
+                        "Expected Return": f"{((median_final / current_value - 1) * 100):.2f}%",
                     })
                 st.dataframe(pd.DataFrame(scenario_stats), width='stretch', hide_index=True)
         
@@ -1145,19 +1918,13 @@ def main():
             st.subheader("What-If Portfolio Analysis")
             st.markdown("**Modify your portfolio and see how changes would impact growth projections.**")
             
-            # Initialize what-if portfolio state
-            if 'whatif_positions' not in st.session_state:
+            # Initialize what-if portfolio state: one array per field
+            if 'whatif' not in st.session_state:
                 # Start with a copy of current positions
-                st.session_state.whatif_positions = [
-                    {
-                        'ticker': pos.ticker,
-                        'shares': pos.shares,
-                        'value': pos.value,
-                        'return_pct': pos.return_pct,
-                        'current_price': pos.current_price,
-                    }
-                    for pos in positions
-                ]
+                st.session_state.whatif = _whatif_from_positions(positions)
+                st.session_state.whatif_version = 0
+                st.session_state.pop('whatif_records', None)
+            whatif = st.session_state.whatif
             
             if 'whatif_dca_schedule' not in st.session_state:
                 st.session_state.whatif_dca_schedule = dca_schedule.copy() if dca_schedule else {}
@@ -1168,162 +1935,81 @@ def main():
             with col_left:
                 st.subheader("📊 Portfolio")
                 
-                if not st.session_state.whatif_positions:
+                if not len(whatif['tickers']):
                     st.info("No positions")
                 else:
-                    # Header row - tighter column widths to prevent overflow
-                    header_cols = st.columns([0.75, 0.65, 0.65, 0.75, 0.55, 0.55, 0.45, 0.35, 0.3])
-                    with header_cols[0]: st.caption("**Ticker**")
-                    with header_cols[1]: st.caption("**Shares**")
-                    with header_cols[2]: st.caption("**Ret%**")
-                    with header_cols[3]: st.caption("**Value**")
-                    with header_cols[4]: st.caption("**DCA$**")
-                    with header_cols[5]: st.caption("**Freq**")
-                    with header_cols[6]: st.caption("**DCA**")
-                    with header_cols[7]: st.caption("**Edit**")
-                    with header_cols[8]: st.caption("**Del**")
-                    
-                    # Position rows - ultra compact with tighter widths
-                    # Use a container that will be wrapped by JavaScript
-                    container_marker = st.empty()
-                    container_marker.markdown('<div id="portfolio-start-marker"></div>', unsafe_allow_html=True)
-                    
-                    for idx, pos_dict in enumerate(st.session_state.whatif_positions):
-                            ticker = pos_dict['ticker']
-                            has_dca = ticker in st.session_state.whatif_dca_schedule
-                            
-                            row_cols = st.columns([0.75, 0.65, 0.65, 0.75, 0.55, 0.55, 0.45, 0.35, 0.3])
-                            
-                            with row_cols[0]:
-                                st.text(ticker)
-                                if has_dca:
-                                    st.caption("💰")
-                            
-                            with row_cols[1]:
-                                new_shares = st.number_input(
-                                    "Shares",
-                                    min_value=0.0,
-                                    value=float(pos_dict['shares']),
-                                    step=0.1,
-                                    format="%.2f",
-                                    label_visibility="collapsed",
-                                    key=f"edit_shares_{idx}"
-                                )
-                            
-                            with row_cols[2]:
-                                new_return = st.number_input(
-                                    "Return %",
-                                    value=float(pos_dict['return_pct']),
-                                    step=0.1,
-                                    format="%.1f",
-                                    label_visibility="collapsed",
-                                    key=f"edit_return_{idx}"
-                                )
-                            
-                            with row_cols[3]:
-                                st.caption(f"${pos_dict['value']:,.0f}")
-                            
-                            with row_cols[4]:
-                                dca_amount = st.number_input(
-                                    "DCA Amount",
-                                    min_value=0.0,
-                                    value=st.session_state.whatif_dca_schedule[ticker]['amount'] if has_dca else 0.0,
-                                    step=10.0,
-                                    format="%.0f",
-                                    key=f"whatif_dca_amount_{idx}_{ticker}",
-                                    label_visibility="collapsed"
-                                )
-                            
-                            with row_cols[5]:
-                                dca_freq = st.selectbox(
-                                    "DCA Frequency",
-                                    options=[7, 14, 21, 30, 60, 90],
-                                    format_func=lambda x: f"{x}d",
-                                    index=[7, 14, 21, 30, 60, 90].index(st.session_state.whatif_dca_schedule[ticker]['frequency_days']) if has_dca else 3,
-                                    key=f"whatif_dca_freq_{idx}_{ticker}",
-                                    label_visibility="collapsed"
-                                )
-                            
-                            with row_cols[6]:
-                                if has_dca:
-                                    if st.button("❌", key=f"whatif_remove_dca_{idx}_{ticker}", help="Remove DCA"):
-                                        del st.session_state.whatif_dca_schedule[ticker]
-                                        st.rerun()
-                                else:
-                                    if st.button("✅", key=f"whatif_add_dca_{idx}_{ticker}", help="Add DCA"):
-                                        if dca_amount > 0:
-                                            st.session_state.whatif_dca_schedule[ticker] = {
-                                                'amount': dca_amount,
-                                                'frequency_days': dca_freq
-                                            }
-                                            st.rerun()
-                            
-                            with row_cols[7]:
-                                if st.button("✏️", key=f"update_pos_{idx}", help="Update"):
-                                    st.session_state.whatif_positions[idx]['shares'] = new_shares
-                                    st.session_state.whatif_positions[idx]['value'] = new_shares * pos_dict['current_price']
-                                    st.session_state.whatif_positions[idx]['return_pct'] = new_return
-                                    st.rerun()
-                            
-                            with row_cols[8]:
-                                if st.button("🗑️", key=f"remove_pos_{idx}", help="Delete"):
-                                    st.session_state.whatif_positions.pop(idx)
-                                    if ticker in st.session_state.whatif_dca_schedule:
-                                        del st.session_state.whatif_dca_schedule[ticker]
-                                    st.rerun()
-                    
-                    # Add end marker and JavaScript to create scrollable container
-                    end_marker = st.empty()
-                    end_marker.markdown('<div id="portfolio-end-marker"></div>', unsafe_allow_html=True)
+                    # One editable grid instead of a row of widgets per position.
+                    # Rows can be deleted here; new tickers come from the panel
+                    # on the right, which knows their prices.
+                    dca_plans = st.session_state.whatif_dca_schedule
+                    editor_df = pd.DataFrame({
+                        'Ticker': whatif['tickers'],
+                        'Shares': whatif['shares'],
+                        'Ret%': whatif['returns'],
+                        'Value': whatif['values'],
+                        'DCA$': [dca_plans[t]['amount'] if t in dca_plans else 0.0 for t in whatif['tickers']],
+                        'Freq': [dca_plans[t]['frequency_days'] if t in dca_plans else 30 for t in whatif['tickers']],
+                        'DCA': [t in dca_plans for t in whatif['tickers']],
+                    })
+                    edited_df = st.data_editor(
+                        editor_df,
+                        key=f"whatif_editor_{st.session_state.whatif_version}",
+                        num_rows="delete",
+                        hide_index=True,
+                        width='stretch',
+                        height=min(400, 35 * (len(editor_df) + 1) + 3),
+                        disabled=['Ticker', 'Value'],
+                        column_config={
+                            'Shares': st.column_config.NumberColumn(min_value=0.0, step=0.1, format="%.2f"),
+                            'Ret%': st.column_config.NumberColumn(step=0.1, format="%.1f"),
+                            'Value': st.column_config.NumberColumn(format="$%.0f"),
+                            'DCA$': st.column_config.NumberColumn(min_value=0.0, step=10.0, format="%.0f"),
+                            'Freq': st.column_config.SelectboxColumn(options=[7, 14, 21, 30, 60, 90], required=True),
+                            'DCA': st.column_config.CheckboxColumn(help="Contribute DCA$ every Freq days"),
+                        },
+                    )
                     
-                    # JavaScript to wrap portfolio rows in scrollable container
-                    st.markdown("""
-                    <script>
-                    setTimeout(function() {
-                        const startMarker = document.getElementById('portfolio-start-marker');
-                        const endMarker = document.getElementById('portfolio-end-marker');
-                        if (startMarker && endMarker) {
-                            const scrollDiv = document.createElement('div');
-                            scrollDiv.style.cssText = 'max-height: 400px; overflow-y: auto; overflow-x: hidden; border: 1px solid rgba(250,250,250,0.2); border-radius: 5px; padding: 8px;';
-                            
-                            let current = startMarker.nextElementSibling;
-                            const nodesToMove = [];
-                            
-                            while (current && current !== endMarker) {
-                                nodesToMove.push(current);
-                                current = current.nextElementSibling;
-                            }
-                            
-                            nodesToMove.forEach(node => {
-                                scrollDiv.appendChild(node);
-                            });
-                            
-                            startMarker.parentNode.insertBefore(scrollDiv, startMarker.nextSibling);
-                            startMarker.remove();
-                            endMarker.remove();
-                        }
-                    }, 100);
-                    </script>
-                    """, unsafe_allow_html=True)
+                    # Apply the grid back to the columns only when something changed
+                    kept = edited_df.index.to_numpy()
+                    new_shares = edited_df['Shares'].fillna(0.0).to_numpy(dtype=np.float64)
+                    new_returns = edited_df['Ret%'].fillna(0.0).to_numpy(dtype=np.float64)
+                    new_dca = {
+                        ticker: {'amount': float(amount), 'frequency_days': int(freq)}
+                        for ticker, amount, freq, active in zip(
+                            edited_df['Ticker'], edited_df['DCA$'].fillna(0.0),
+                            edited_df['Freq'], edited_df['DCA'],
+                        )
+                        if active and amount > 0
+                    }
+                    rows_changed = len(kept) != len(whatif['tickers'])
+                    if rows_changed:
+                        for column in whatif:
+                            whatif[column] = whatif[column][kept]
+                    if (
+                        rows_changed
+                        or not np.array_equal(new_shares, whatif['shares'])
+                        or not np.array_equal(new_returns, whatif['returns'])
+                        or new_dca != dca_plans
+                    ):
+                        whatif['shares'] = new_shares
+                        whatif['values'] = new_shares * whatif['prices']
+                        whatif['returns'] = new_returns
+                        st.session_state.whatif_dca_schedule = new_dca
+                        # Edits are now in the columns, which the rest of this
+                        # run reads; start the next run's grid clean
+                        st.session_state.whatif_version += 1
                     
                     # Show position count
-                    total_count = len(st.session_state.whatif_positions)
+                    total_count = len(whatif['tickers'])
                     st.caption(f"Total positions: {total_count}")
             
             with col_right:
                 st.subheader("➕ Add Positions")
                 
                 if st.session_state.watchlist:
-                    # Load watchlist data (non-blocking)
-                    cache_key = f"watchlist_cache_{use_realtime}_{hash(tuple(w.get('ticker', '') for w in st.session_state.watchlist))}"
-                    
-                    if cache_key not in st.session_state:
-                        with st.spinner("📡 Loading..."):
-                            st.session_state[cache_key] = update_watchlist_with_realtime(
-                                st.session_state.watchlist, use_realtime
-                            )
-                    
-                    updated_watchlist = st.session_state[cache_key]
+                    updated_watchlist, watch_map = _cached_watchlist(
+                        st.session_state.watchlist, use_realtime
+                    )
                     
                     # Compact watchlist selector
                     selected_tickers = st.multiselect(
@@ -1351,12 +2037,12 @@ def main():
                         with config_col1:
                             allocation_method = st.radio(
                                 "Add by:",
-                                ["$ Amount", "Shares"],
+                                [ALLOC_DOLLARS, ALLOC_SHARES],
                                 horizontal=True,
                                 key="whatif_allocation_method"
                             )
-                            if allocation_method == "$ Amount":
-                                allocation_value = st.number_input(
+                            if allocation_method == ALLOC_DOLLARS:
+                                st.number_input(
                                     "$ per ticker",
                                     min_value=0.0,
                                     value=1000.0,
@@ -1364,7 +2050,7 @@ def main():
                                     key="whatif_allocation_value"
                                 )
                             else:
-                                shares_per_ticker = st.number_input(
+                                st.number_input(
                                     "Shares",
                                     min_value=0.0,
                                     value=10.0,
@@ -1380,7 +2066,7 @@ def main():
                                 key="whatif_use_return"
                             )
                             if not use_watchlist_return:
-                                manual_return = st.number_input(
+                                st.number_input(
                                     "Return %",
                                     value=10.0,
                                     step=0.1,
@@ -1393,17 +2079,15 @@ def main():
                                 value=False,
                                 key="whatif_enable_dca_new"
                             )
-                            dca_amount_new = 0.0
-                            dca_freq_new = 30
                             if enable_dca_new:
-                                dca_amount_new = st.number_input(
+                                st.number_input(
                                     "DCA $",
                                     min_value=0.0,
                                     value=100.0,
                                     step=10.0,
                                     key="whatif_dca_amount_new"
                                 )
-                                dca_freq_new = st.selectbox(
+                                st.selectbox(
                                     "Freq",
                                     options=[7, 14, 21, 30, 60, 90],
                                     format_func=lambda x: f"{x}d",
@@ -1411,75 +2095,26 @@ def main():
                                     key="whatif_dca_freq_new"
                                 )
                         
-                        if st.button("➕ Add Positions", type="primary", use_container_width=True):
-                            watch_map = {w["ticker"]: WatchItem(
-                                ticker=w["ticker"],
-                                name=w.get("name", w["ticker"]),
-                                current_price=w["current_price"],
-                                today_return_pct=w["today_return_pct"],
-                                total_return_pct=w.get("total_return_pct", w.get("ytd_return_pct", 0.0)),
-                            ) for w in updated_watchlist}
-                            
-                            for ticker in selected_tickers:
-                                watch_item = watch_map.get(ticker)
-                                if not watch_item:
-                                    continue
-                                
-                                # Determine return
-                                if use_watchlist_return and watch_item.total_return_pct is not None:
-                                    return_pct = watch_item.total_return_pct
-                                elif use_watchlist_return:
-                                    return_pct = watch_item.today_return_pct * 252
-                                else:
-                                    return_pct = manual_return
-                                
-                                # Calculate shares and value
-                                if allocation_method == "Dollar Amount ($)":
-                                    position_value = allocation_value
-                                    shares = position_value / watch_item.current_price if watch_item.current_price > 0 else 0
-                                else:
-                                    shares = shares_per_ticker
-                                    position_value = shares * watch_item.current_price
-                                
-                                # Check if exists
-                                existing_idx = next((i for i, p in enumerate(st.session_state.whatif_positions) if p['ticker'] == ticker), None)
-                                if existing_idx is not None:
-                                    # Add to existing
-                                    st.session_state.whatif_positions[existing_idx]['shares'] += shares
-                                    st.session_state.whatif_positions[existing_idx]['value'] += position_value
-                                else:
-                                    # Add new
-                                    st.session_state.whatif_positions.append({
-                                        'ticker': ticker,
-                                        'shares': shares,
-                                        'value': position_value,
-                                        'return_pct': return_pct,
-                                        'current_price': watch_item.current_price,
-                                    })
-                                
-                                # Add DCA if enabled
-                                if enable_dca_new and dca_amount_new > 0:
-                                    st.session_state.whatif_dca_schedule[ticker] = {
-                                        'amount': dca_amount_new,
-                                        'frequency_days': dca_freq_new
-                                    }
-                            
-                            st.rerun()
+                        st.button(
+                            "➕ Add Positions",
+                            type="primary",
+                            use_container_width=True,
+                            on_click=_add_whatif_positions,
+                            args=(watch_map,),
+                        )
                 else:
                     st.info("No watchlist available")
             
-            # Convert what-if positions to Position objects for simulation
-            whatif_position_objects = []
-            for pos_dict in st.session_state.whatif_positions:
-                whatif_position_objects.append(Position(
-                    ticker=pos_dict['ticker'],
-                    value=pos_dict['value'],
-                    return_pct=pos_dict['return_pct'],
-                    current_price=pos_dict['current_price'],
-                ))
+            # The simulation reads the columns as one record array, packed
+            # again only after an edit (every edit bumps whatif_version)
+            records_entry = st.session_state.get('whatif_records')
+            if records_entry is None or records_entry[0] != st.session_state.whatif_version:
+                records_entry = (st.session_state.whatif_version, _whatif_records(whatif))
+                st.session_state.whatif_records = records_entry
+            whatif_records = records_entry[1]
             
-            if whatif_position_objects:
-                whatif_total_value = sum(pos.value for pos in whatif_position_objects)
+            if len(whatif_records):
+                whatif_total_value = float(whatif['values'].sum())
                 
                 # Compact summary row
                 summary_col1, summary_col2, summary_col3 = st.columns(3)
@@ -1497,32 +2132,26 @@ def main():
                 st.subheader("📈 Growth Comparison")
                 
                 # Check cache
-                whatif_positions_tuple = tuple((p.ticker, p.value, p.return_pct, p.current_price) for p in whatif_position_objects)
-                # Convert DCA schedule to hashable format (tuple of tuples)
-                if st.session_state.whatif_dca_schedule:
-                    whatif_dca_tuple = tuple(sorted(
-                        (ticker, config['amount'], config['frequency_days'])
-                        for ticker, config in st.session_state.whatif_dca_schedule.items()
-                    ))
-                else:
-                    whatif_dca_tuple = None
-                whatif_hash = hash((whatif_positions_tuple, sigma, days, n_sims, random_seed, whatif_dca_tuple))
-                whatif_cache_key = f"whatif_sim_{whatif_hash}"
+                whatif_cache_key = simulation_cache_key(
+                    "whatif_sim", whatif_records, (sigma,), days, n_sims,
+                    random_seed, st.session_state.whatif_dca_schedule,
+                )
+                cached = st.session_state.get("whatif_sim")
                 
-                if whatif_cache_key in st.session_state:
-                    whatif_paths, whatif_time_points = st.session_state[whatif_cache_key]
+                if cached is not None and cached[0] == whatif_cache_key:
+                    whatif_paths, whatif_time_points = cached[1]
                 else:
                     with st.status("🔄 Running simulation...", expanded=True) as status:
                         status.update(label="🔄 Simulating portfolio growth...", state="running")
                         whatif_paths, whatif_time_points = simulate_portfolio_growth_over_time(
-                            whatif_position_objects,
+                            whatif_records,
                             sigma=sigma,
                             days=days,
                             n_sims=n_sims,
                             random_seed=random_seed,
                             dca_schedule=st.session_state.whatif_dca_schedule,
                         )
-                        st.session_state[whatif_cache_key] = (whatif_paths, whatif_time_points)
+                        st.session_state["whatif_sim"] = (whatif_cache_key, (whatif_paths, whatif_time_points))
                         status.update(label="✅ Simulation complete!", state="complete")
                 
                 # Compare scenarios
@@ -1543,326 +2172,320 @@ def main():
                 
                 if show_explanation:
                     # Compact comparison metrics
-                    original_final = base_portfolio_paths[:, -1]
-                    whatif_final = whatif_paths[:, -1]
+                    (original_median,) = _quantiles(base_portfolio_paths[:, -1], (0.5,))
+                    whatif_worst, whatif_median, whatif_best = _quantiles(whatif_paths[:, -1])
                     
                     comp_col1, comp_col2, comp_col3, comp_col4 = st.columns(4)
                     with comp_col1:
-                        st.metric("Original Final", f"${np.median(original_final):,.0f}")
-                        st.caption(f"Return: {((np.median(original_final) / current_value - 1) * 100):.1f}%")
+                        st.metric("Original Final", f"${original_median:,.0f}")
+                        st.caption(f"Return: {((original_median / current_value - 1) * 100):.1f}%")
                     with comp_col2:
-                        st.metric("What-If Final", f"${np.median(whatif_final):,.0f}")
-                        st.caption(f"Return: {((np.median(whatif_final) / whatif_total_value - 1) * 100):.1f}%")
+                        st.metric("What-If Final", f"${whatif_median:,.0f}")
+                        st.caption(f"Return: {((whatif_median / whatif_total_value - 1) * 100):.1f}%")
                     with comp_col3:
-                        diff = np.median(whatif_final) - np.median(original_final)
-                        diff_pct = ((diff / np.median(original_final)) * 100) if np.median(original_final) > 0 else 0
+                        diff = whatif_median - original_median
+                        diff_pct = ((diff / original_median) * 100) if original_median > 0 else 0
                         st.metric("Difference", f"${diff:,.0f}", delta=f"{diff_pct:.1f}%")
                     with comp_col4:
-                        st.metric("Best Case", f"${np.percentile(whatif_final, 95):,.0f}")
-                        st.caption(f"Worst: ${np.percentile(whatif_final, 5):,.0f}")
+                        st.metric("Best Case", f"${whatif_best:,.0f}")
+                        st.caption(f"Worst: ${whatif_worst:,.0f}")
             else:
                 st.info("Add positions to see projections")
     
-    with tab2:
-        st.header("Compare Different Prediction Scenarios")
-        
-        # Create different scenarios
-        scenarios = {
-            "Conservative (σ=0.10)": analyse_portfolio(
-                positions, sigma=0.10, days=days, n_sims=n_sims, random_seed=random_seed
-            ),
-            "Moderate (σ=0.15)": analyse_portfolio(
-                positions, sigma=0.15, days=days, n_sims=n_sims, random_seed=random_seed
-            ),
-            "Aggressive (σ=0.25)": analyse_portfolio(
-                positions, sigma=0.25, days=days, n_sims=n_sims, random_seed=random_seed
-            ),
-        }
-        
-        # Add time horizon scenarios
-        scenarios["Short-term (90 days)"] = analyse_portfolio(
-            positions, sigma=sigma, days=90, n_sims=n_sims, random_seed=random_seed
-        )
-        scenarios["Long-term (500 days)"] = analyse_portfolio(
-            positions, sigma=sigma, days=500, n_sims=n_sims, random_seed=random_seed
-        )
-        
-        # Display comparison chart
-        comparison_chart = create_prediction_comparison_chart(scenarios, current_value)
-        st.plotly_chart(comparison_chart, width='stretch', key='comparison_chart')
-        
-        # Scenario details table
-        st.subheader("Scenario Details")
-        scenario_data = []
-        for name, data in scenarios.items():
-            scenario_data.append({
-                "Scenario": name,
-                "Predicted Value": f"${data['predicted_portfolio_value']:,.2f}",
-                "Predicted Return %": f"{data['predicted_portfolio_return_pct']:.2f}%",
-                "Expected Gain": f"${data['predicted_portfolio_value'] - current_value:,.2f}",
-            })
-        st.dataframe(pd.DataFrame(scenario_data), width='stretch')
-    
-    with tab3:
-        st.header("Portfolio Position Details")
-        
-        # Create positions dataframe (with loading indicator for many positions)
-        pos_data = []
-        if len(positions) > 10:
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-        
-        for idx, pos in enumerate(positions):
-            if len(positions) > 10:
-                status_text.text(f"Analyzing {pos.ticker}... ({idx+1}/{len(positions)})")
-                progress_bar.progress((idx + 1) / len(positions))
+    if tab2.open:
+        with tab2:
+            st.header("Compare Different Prediction Scenarios")
             
-            pred = predict_position(pos, sigma=sigma, days=days, n_sims=n_sims, random_seed=random_seed)
-            pos_data.append({
-                "Ticker": pos.ticker,
-                "Current Value": f"${pos.value:,.2f}",
-                "Shares": f"{pos.shares:.2f}",
-                "Current Price": f"${pos.current_price:.2f}",
-                "Historical Return %": f"{pos.return_pct:.2f}%",
-                "Predicted Price": f"${pred['expected_price']:.2f}",
-                "Predicted Return %": f"{pred['expected_return_pct']:.2f}%",
-                "Weight %": f"{(pos.value / current_value * 100):.2f}%",
-            })
-        
-        if len(positions) > 10:
-            progress_bar.empty()
-            status_text.empty()
-        
-        df = pd.DataFrame(pos_data)
-        st.dataframe(df, width='stretch')
-        
-        # Portfolio allocation pie chart
-        st.subheader("Portfolio Allocation")
-        allocation_fig = px.pie(
-            values=[pos.value for pos in positions],
-            names=[pos.ticker for pos in positions],
-            title="Portfolio Value Allocation by Position"
-        )
-        st.plotly_chart(allocation_fig, width='stretch', key='allocation_chart')
-    
-    with tab4:
-        st.header("Individual Position Predictions")
-        
-        # Create charts for each position
-        for idx, pos in enumerate(positions):
-            with st.expander(f"📊 {pos.ticker} - {pos.shares:.2f} shares @ ${pos.current_price:.2f} (Value: ${pos.value:,.2f})"):
-                # Simulate individual position
-                mu = pos.return_pct / 100.0
-                prices_end = simulate_gbm_price(
-                    current_price=pos.current_price,
-                    mu=mu,
-                    sigma=sigma,
-                    days=days,
-                    n_sims=n_sims,
-                    random_seed=random_seed,
-                )
-                
-                # Create histogram of predicted prices
-                fig = go.Figure()
-                fig.add_trace(go.Histogram(
-                    x=prices_end,
-                    nbinsx=50,
-                    name='Price Distribution',
-                    marker_color='lightblue',
-                ))
-                
-                # Add current price line
-                fig.add_vline(
-                    x=pos.current_price,
-                    line_dash="dash",
-                    line_color="red",
-                    annotation_text=f"Current: ${pos.current_price:.2f}",
-                )
-                
-                # Add expected price line
-                expected_price = float(prices_end.mean())
-                fig.add_vline(
-                    x=expected_price,
-                    line_dash="dash",
-                    line_color="green",
-                    annotation_text=f"Expected: ${expected_price:.2f}",
-                )
-                
-                fig.update_layout(
-                    title=f'{pos.ticker} Price Distribution After {days} Days',
-                    xaxis_title='Price ($)',
-                    yaxis_title='Frequency',
-                    height=400,
-                    template='plotly_white',
-                )
-                
-                st.plotly_chart(fig, width='stretch', key=f'position_chart_{idx}_{pos.ticker}')
-                
-                # Statistics
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("Expected Price", f"${expected_price:.2f}")
-                with col2:
-                    st.metric("Expected Return", f"{((expected_price / pos.current_price - 1) * 100):.2f}%")
-                with col3:
-                    st.metric("5th Percentile", f"${np.percentile(prices_end, 5):.2f}")
-                with col4:
-                    st.metric("95th Percentile", f"${np.percentile(prices_end, 95):.2f}")
-    
-    with tab5:
-        st.header("Watchlist Analysis")
-        
-        if not st.session_state.watchlist:
-            st.info("No items in watchlist. Add items to portfolio_data.json to see them here.")
-        else:
-            # Cache watchlist updates in session state to avoid refetching
-            cache_key = f"watchlist_tab5_cache_{use_realtime}_{hash(tuple(w.get('ticker', '') for w in st.session_state.watchlist))}"
+            # Create different scenarios: volatility variants, then time
+            # horizon variants, all from one batched simulation
+            scenario_params = {
+                "Conservative (σ=0.10)": (0.10, days),
+                "Moderate (σ=0.15)": (0.15, days),
+                "Aggressive (σ=0.25)": (0.25, days),
+                "Short-term (90 days)": (sigma, 90),
+                "Long-term (500 days)": (sigma, 500),
+            }
+            scenarios = dict(zip(scenario_params, analyse_portfolio_batch_cached(
+                positions, tuple(scenario_params.values()), n_sims=n_sims, random_seed=random_seed
+            )))
             
-            if cache_key not in st.session_state:
-                st.session_state[cache_key] = update_watchlist_with_realtime(
-                    st.session_state.watchlist, use_realtime
-                )
-            
-            updated_watchlist = st.session_state[cache_key]
+            # Display comparison chart
+            comparison_chart = create_prediction_comparison_chart(scenarios, current_value)
+            st.plotly_chart(comparison_chart, width='stretch', key='comparison_chart')
             
-            # Convert to WatchItem objects
-            watchlist_items = []
-            for item in updated_watchlist:
-                watchlist_items.append(WatchItem(
-                    ticker=item["ticker"],
-                    name=item.get("name", item["ticker"]),
-                    current_price=item["current_price"],
-                    today_return_pct=item["today_return_pct"],
-                    total_return_pct=item.get("total_return_pct"),
-                ))
+            # Scenario details table
+            st.subheader("Scenario Details")
+            scenario_data = []
+            for name, data in scenarios.items():
+                scenario_data.append({
+                    "Scenario": name,
+                    "Predicted Value": f"${data['predicted_portfolio_value']:,.2f}",
+                    "Predicted Return %": f"{data['predicted_portfolio_return_pct']:.2f}%",
+                    "Expected Gain": f"${data['predicted_portfolio_value'] - current_value:,.2f}",
+                })
+            st.dataframe(pd.DataFrame(scenario_data), width='stretch')
+        
+    if tab3.open:
+        with tab3:
+            st.header("Portfolio Position Details")
             
-            # Analyze watchlist
-            watch_results = analyse_watchlist(
-                watchlist_items,
-                sigma=sigma,
-                days=days,
-                n_sims=n_sims,
-                random_seed=random_seed,
+            # Create positions dataframe; every position is predicted in one
+            # batched simulation
+            predictions = predict_positions_batch_cached(
+                positions, sigma=sigma, days=days, n_sims=n_sims, random_seed=random_seed
             )
+            predicted = [predictions[pos.ticker] for pos in positions]
+            # Numeric columns, formatted by the table rather than as strings, so
+            # they also sort numerically
+            df = pd.DataFrame({
+                "Ticker": position_records['ticker'],
+                "Current Value": position_records['value'],
+                "Shares": [pos.shares for pos in positions],
+                "Current Price": position_records['current_price'],
+                "Historical Return %": position_records['return_pct'],
+                "Predicted Price": [pred['expected_price'] for pred in predicted],
+                "Predicted Return %": [pred['expected_return_pct'] for pred in predicted],
+                "Weight %": position_records['value'] / current_value * 100,
+            })
+            st.dataframe(df, width='stretch', column_config={
+                "Current Value": st.column_config.NumberColumn(format="dollar"),
+                "Shares": st.column_config.NumberColumn(format="%.2f"),
+                "Current Price": st.column_config.NumberColumn(format="$%.2f"),
+                "Historical Return %": st.column_config.NumberColumn(format="%.2f%%"),
+                "Predicted Price": st.column_config.NumberColumn(format="$%.2f"),
+                "Predicted Return %": st.column_config.NumberColumn(format="%.2f%%"),
+                "Weight %": st.column_config.NumberColumn(format="%.2f%%"),
+            })
             
-            # Display watchlist table
-            st.subheader("Watchlist Items")
-            watchlist_data = []
-            for ticker, exp_ret, exp_price in watch_results:
-                item = next((w for w in updated_watchlist if w["ticker"] == ticker), None)
-                if item:
-                    watchlist_data.append({
-                        "Ticker": ticker,
-                        "Name": item.get("name", ticker),
-                        "Current Price": f"${item['current_price']:.2f}",
-                        "Today Return %": f"{item['today_return_pct']:.2f}%",
-                        "Predicted Return %": f"{exp_ret:.2f}%",
-                        "Predicted Price": f"${exp_price:.2f}",
-                    })
-            
-            df_watchlist = pd.DataFrame(watchlist_data)
-            st.dataframe(df_watchlist, width='stretch', hide_index=True)
-            
-            # Add to portfolio section
-            st.subheader("Add to Portfolio")
-            selected_tickers = st.multiselect(
-                "Select tickers to add to portfolio",
-                options=[w["ticker"] for w in updated_watchlist],
-                help="Select one or more tickers from your watchlist to add to your portfolio"
-            )
+            # Portfolio allocation pie chart: the largest positions, with the
+            # rest rolled into one "Other" slice so the chart stays readable
+            st.subheader("Portfolio Allocation")
+            values = position_records['value']
+            order = np.argsort(-values, kind='stable')
+            top = order[:ALLOCATION_PIE_SLICES]
+            labels = position_records['ticker'][top].tolist()
+            slice_values = values[top].tolist()
+            other_value = values[order[ALLOCATION_PIE_SLICES:]].sum()
+            if other_value > 0:
+                labels.append("Other")
+                slice_values.append(other_value)
+            allocation_fig = go.Figure(go.Pie(labels=labels, values=slice_values, sort=False))
+            allocation_fig.update_layout(title="Portfolio Value Allocation by Position")
+            st.plotly_chart(allocation_fig, width='stretch', key='allocation_chart')
+        
+    if tab4.open:
+        with tab4:
+            st.header("Individual Position Predictions")
             
-            if selected_tickers:
-                allocation_value = st.number_input(
-                    "Allocation per ticker ($)",
-                    min_value=0.0,
-                    value=1000.0,
-                    step=100.0,
-                    help="Amount to invest in each selected ticker"
+            # Create charts for each position. Expanders track whether they
+            # are open, so only expanded positions are simulated and charted
+            for idx, pos in enumerate(positions):
+                expander = st.expander(
+                    f"📊 {pos.ticker} - {pos.shares:.2f} shares @ ${pos.current_price:.2f} (Value: ${pos.value:,.2f})",
+                    key=f"position_expander_{idx}_{pos.ticker}",
+                    on_change="rerun",
                 )
-                
-                if st.button("➕ Add Selected to Portfolio"):
-                    watch_map = {w["ticker"]: WatchItem(
-                        ticker=w["ticker"],
-                        name=w.get("name", w["ticker"]),
-                        current_price=w["current_price"],
-                        today_return_pct=w["today_return_pct"],
-                        total_return_pct=w.get("total_return_pct"),
-                    ) for w in updated_watchlist}
+                with expander:
+                    if not expander.open:
+                        continue
+                    # Simulate individual position
+                    mu = pos.return_pct / 100.0
+                    prices_end = simulate_gbm_price_cached(
+                        current_price=pos.current_price,
+                        mu=mu,
+                        sigma=sigma,
+                        days=days,
+                        n_sims=n_sims,
+                        random_seed=random_seed,
+                    )
                     
-                    current_positions = [Position(**p) for p in updated_positions]
-                    new_positions = add_positions(
-                        current_positions,
-                        watch_map,
-                        selected_tickers,
-                        allocation_value,
+                    # Create histogram of predicted prices, binned here so only the
+                    # 50 bars are sent to the browser rather than every path
+                    counts, edges = np.histogram(prices_end, bins=50)
+                    fig = go.Figure()
+                    fig.add_trace(go.Bar(
+                        x=np.round((edges[:-1] + edges[1:]) / 2, 2),
+                        y=counts,
+                        width=np.diff(edges),
+                        name='Price Distribution',
+                        marker_color='lightblue',
+                    ))
+                    
+                    # Add current price line
+                    fig.add_vline(
+                        x=pos.current_price,
+                        line_dash="dash",
+                        line_color="red",
+                        annotation_text=f"Current: ${pos.current_price:.2f}",
                     )
                     
-                    # Convert back to dict format and update session state
-                    st.session_state.positions = [
-                        {
-                            "ticker": pos.ticker,
-                            "value": pos.value,
-                            "return_pct": pos.return_pct,
-                            "current_price": pos.current_price,
-                        }
-                        for pos in new_positions
-                    ]
-                    st.success(f"Added {len(selected_tickers)} position(s) to portfolio!")
-                    st.rerun()
+                    # Add expected price line
+                    expected_price = float(prices_end.mean())
+                    fig.add_vline(
+                        x=expected_price,
+                        line_dash="dash",
+                        line_color="green",
+                        annotation_text=f"Expected: ${expected_price:.2f}",
+                    )
+                    
+                    fig.update_layout(
+                        title=f'{pos.ticker} Price Distribution After {days} Days',
+                        xaxis_title='Price ($)',
+                        yaxis_title='Frequency',
+                        height=400,
+                        template='plotly_white',
+                    )
+                    
+                    st.plotly_chart(fig, width='stretch', key=f'position_chart_{idx}_{pos.ticker}')
+                    
+                    # Statistics
+                    price_p5, price_p95 = _quantiles(prices_end, (0.05, 0.95))
+                    col1, col2, col3, col4 = st.columns(4)
+                    with col1:
+                        st.metric("Expected Price", f"${expected_price:.2f}")
+                    with col2:
+                        st.metric("Expected Return", f"{((expected_price / pos.current_price - 1) * 100):.2f}%")
+                    with col3:
+                        st.metric("5th Percentile", f"${price_p5:.2f}")
+                    with col4:
+                        st.metric("95th Percentile", f"${price_p95:.2f}")
+        
+    if tab5.open:
+        with tab5:
+            st.header("Watchlist Analysis")
             
-            # Watchlist predictions chart
-            st.subheader("Watchlist Predictions Comparison")
-            if watch_results:
-                tickers = [r[0] for r in watch_results]
-                exp_returns = [r[1] for r in watch_results]
-                exp_prices = [r[2] for r in watch_results]
+            if not st.session_state.watchlist:
+                st.info("No items in watchlist. Add items to portfolio_data.json to see them here.")
+            else:
+                # Ticker -> WatchItem serves the analysis, the table lookups and
+                # the Add Selected button alike
+                updated_watchlist, watch_map = _cached_watchlist(st.session_state.watchlist, use_realtime)
                 
-                fig = make_subplots(
-                    rows=1, cols=2,
-                    subplot_titles=('Predicted Returns (%)', 'Predicted Prices ($)'),
-                    specs=[[{"type": "bar"}, {"type": "bar"}]]
+                # Analyze watchlist
+                watch_results = analyse_watchlist_cached(
+                    list(watch_map.values()),
+                    sigma=sigma,
+                    days=days,
+                    n_sims=n_sims,
+                    random_seed=random_seed,
                 )
                 
-                # Returns chart
-                colors = ['green' if r > 0 else 'red' for r in exp_returns]
-                fig.add_trace(
-                    go.Bar(
-                        x=tickers[:20],  # Limit to top 20 for readability
-                        y=exp_returns[:20],
-                        name='Predicted Return %',
-                        marker_color=colors[:20],
-                        text=[f'{r:.2f}%' for r in exp_returns[:20]],
-                        textposition='outside',
-                    ),
-                    row=1, col=1
-                )
+                # Display watchlist table
+                st.subheader("Watchlist Items")
+                watchlist_rows = []
+                for ticker, exp_ret, exp_price in watch_results:
+                    item = watch_map.get(ticker)
+                    if item:
+                        watchlist_rows.append((
+                            ticker, item.name, item.current_price,
+                            item.today_return_pct, exp_ret, exp_price,
+                        ))
                 
-                # Prices chart
-                fig.add_trace(
-                    go.Bar(
-                        x=tickers[:20],
-                        y=exp_prices[:20],
-                        name='Predicted Price',
-                        marker_color='lightblue',
-                        text=[f'${p:.2f}' for p in exp_prices[:20]],
-                        textposition='outside',
-                    ),
-                    row=1, col=2
-                )
+                df_watchlist = pd.DataFrame.from_records(watchlist_rows, columns=[
+                    "Ticker", "Name", "Current Price", "Today Return %",
+                    "Predicted Return %", "Predicted Price",
+                ])
+                st.dataframe(df_watchlist, width='stretch', hide_index=True, column_config={
+                    "Current Price": st.column_config.NumberColumn(format="$%.2f"),
+                    "Today Return %": st.column_config.NumberColumn(format="%.2f%%"),
+                    "Predicted Return %": st.column_config.NumberColumn(format="%.2f%%"),
+                    "Predicted Price": st.column_config.NumberColumn(format="$%.2f"),
+                })
                 
-                fig.update_layout(
-                    title='Top 20 Watchlist Predictions',
-                    height=500,
-                    showlegend=False,
-                    template='plotly_white',
+                # Add to portfolio section
+                st.subheader("Add to Portfolio")
+                selected_tickers = st.multiselect(
+                    "Select tickers to add to portfolio",
+                    options=[w["ticker"] for w in updated_watchlist],
+                    help="Select one or more tickers from your watchlist to add to your portfolio"
                 )
                 
-                fig.update_xaxes(title_text="Ticker", row=1, col=1)
-                fig.update_xaxes(title_text="Ticker", row=1, col=2)
-                fig.update_yaxes(title_text="Return (%)", row=1, col=1)
-                fig.update_yaxes(title_text="Price ($)", row=1, col=2)
+                if selected_tickers:
+                    allocation_value = st.number_input(
+                        "Allocation per ticker ($)",
+                        min_value=0.0,
+                        value=1000.0,
+                        step=100.0,
+                        help="Amount to invest in each selected ticker"
+                    )
+                    
+                    if st.button("➕ Add Selected to Portfolio"):
+                        new_positions = add_positions(
+                            positions,
+                            watch_map,
+                            selected_tickers,
+                            allocation_value,
+                        )
+                        
+                        # Convert back to dict format and update session state
+                        st.session_state.positions = [
+                            {
+                                "ticker": pos.ticker,
+                                "value": pos.value,
+                                "return_pct": pos.return_pct,
+                                "current_price": pos.current_price,
+                            }
+                            for pos in new_positions
+                        ]
+                        st.success(f"Added {len(selected_tickers)} position(s) to portfolio!")
+                        st.rerun()
                 
-                st.plotly_chart(fig, width='stretch', key='watchlist_chart')
+                # Watchlist predictions chart
+                st.subheader("Watchlist Predictions Comparison")
+                if watch_results:
+                    # Results are sorted by predicted return; chart the top 20
+                    # for readability
+                    top_results = watch_results[:20]
+                    tickers = [r[0] for r in top_results]
+                    exp_returns = [r[1] for r in top_results]
+                    exp_prices = [r[2] for r in top_results]
+                    
+                    fig = make_subplots(
+                        rows=1, cols=2,
+                        subplot_titles=('Predicted Returns (%)', 'Predicted Prices ($)'),
+                        specs=[[{"type": "bar"}, {"type": "bar"}]]
+                    )
+                    
+                    # Returns chart
+                    colors = ['green' if r > 0 else 'red' for r in exp_returns]
+                    fig.add_trace(
+                        go.Bar(
+                            x=tickers,
+                            y=exp_returns,
+                            name='Predicted Return %',
+                            marker_color=colors,
+                            text=[f'{r:.2f}%' for r in exp_returns],
+                            textposition='outside',
+                        ),
+                        row=1, col=1
+                    )
+                    
+                    # Prices chart
+                    fig.add_trace(
+                        go.Bar(
+                            x=tickers,
+                            y=exp_prices,
+                            name='Predicted Price',
+                            marker_color='lightblue',
+                            text=[f'${p:.2f}' for p in exp_prices],
+                            textposition='outside',
+                        ),
+                        row=1, col=2
+                    )
+                    
+                    fig.update_layout(
+                        title='Top 20 Watchlist Predictions',
+                        height=500,
+                        showlegend=False,
+                        template='plotly_white',
+                    )
+                    
+                    fig.update_xaxes(title_text="Ticker", row=1, col=1)
+                    fig.update_xaxes(title_text="Ticker", row=1, col=2)
+                    fig.update_yaxes(title_text="Return (%)", row=1, col=1)
+                    fig.update_yaxes(title_text="Price ($)", row=1, col=2)
+                    
+                    st.plotly_chart(fig, width='stretch', key='watchlist_chart')
 
 
 if __name__ == "__main__":
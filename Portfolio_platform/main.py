@@ -41,11 +41,16 @@ from __future__ import annotations
 import json
 import math
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 
 
+# Time step of one trading day, in years (252 trading days per year)
+_DT = 1.0 / 252.0
+_SQRT_DT = math.sqrt(_DT)
+
+
 @dataclass
 class Position:
     """Represents a single holding in the portfolio."""
@@ -62,6 +67,49 @@ class Position:
         return 0.0
 
 
+@dataclass
+class Portfolio:
+    """A portfolio as parallel arrays, one entry per position.
+
+    The same data as a list of Position objects, laid out so whole-portfolio
+    maths (totals, weights, shares) runs as NumPy array operations.
+    """
+    tickers: np.ndarray
+    values: np.ndarray
+    return_pcts: np.ndarray
+    prices: np.ndarray
+
+    @classmethod
+    def from_positions(
+        cls,
+        positions: Union["Portfolio", Iterable[Union[Position, Dict]]],
+    ) -> "Portfolio":
+        """Build from Position objects or position dicts (passed through if already a Portfolio)."""
+        if isinstance(positions, Portfolio):
+            return positions
+        rows = [
+            (pos["ticker"], pos["value"], pos["return_pct"], pos["current_price"])
+            if isinstance(pos, dict)
+            else (pos.ticker, pos.value, pos.return_pct, pos.current_price)
+            for pos in positions
+        ]
+        tickers, values, return_pcts, prices = zip(*rows) if rows else ((), (), (), ())
+        return cls(
+            tickers=np.array(tickers, dtype=str),
+            values=np.array(values, dtype=np.float64),
+            return_pcts=np.array(return_pcts, dtype=np.float64),
+            prices=np.array(prices, dtype=np.float64),
+        )
+
+    @property
+    def shares(self) -> np.ndarray:
+        """Shares held in each position (0 where the price is not positive)."""
+        return np.divide(
+            self.values, self.prices,
+            out=np.zeros_like(self.values), where=self.prices > 0,
+        )
+
+
 @dataclass
 class WatchItem:
     """Represents an item on the investment watchlist."""
@@ -94,39 +142,70 @@ def simulate_gbm_price(
     Returns:
         An array of simulated prices at the end of the period for each path.
     """
-    if random_seed is not None:
-        np.random.seed(random_seed)
+    rng = np.random.default_rng(random_seed)
 
-    dt = 1.0 / 252.0  # assume 252 trading days per year
     # Pre‑compute drift and diffusion constants
-    drift = (mu - 0.5 * sigma ** 2) * dt
-    diffusion_std = sigma * math.sqrt(dt)
-    # Simulate log returns
+    drift = (mu - 0.5 * sigma ** 2) * _DT
+    diffusion_std = sigma * _SQRT_DT
+    # Only the end price is returned, and it depends on the daily shocks only
+    # through their sum; the sum of `days` standard normals is N(0, days), so
+    # each path needs a single draw
+    # Built up in place in the one buffer the draws are written into
     prices_end = np.empty(n_sims)
-    for i in range(n_sims):
-        increments = np.random.normal(loc=0.0, scale=1.0, size=days)
-        # cumulative log return
-        log_returns = drift + diffusion_std * increments
-        # accumulate
-        price = current_price * np.exp(log_returns.sum())
-        prices_end[i] = price
+    rng.standard_normal(out=prices_end)
+    prices_end *= math.sqrt(days) * diffusion_std
+    prices_end += days * drift
+    np.exp(prices_end, out=prices_end)
+    prices_end *= current_price
     return prices_end
 
 
-def portfolio_summary(positions: Iterable[Position]) -> Dict[str, float]:
+def analytic_expected_price(current_price, mu, days: int = 252):
+    """Closed-form expected end price under geometric Brownian motion.
+
+    E[S_T] = S_0 * exp(µ * T), whatever the volatility, so no simulation is
+    needed when only the mean is wanted.  Works on floats or NumPy arrays.
+
+    Args:
+        current_price: The starting price of the asset.
+        mu: Annualised drift (mean return).
+        days: Number of trading days in the horizon.
+
+    Returns:
+        The expected price at the end of the period.
+    """
+    return current_price * np.exp(mu * days * _DT)
+
+
+def portfolio_summary(positions: Union[Portfolio, Iterable[Position]]) -> Dict[str, float]:
     """Calculate total value and weighted historical return of a portfolio.
 
     Args:
-        positions: Iterable of Position objects.
+        positions: Iterable of Position objects, or a Portfolio.
 
     Returns:
         A dictionary with total_value and weighted_return_pct keys.
     """
-    total_value = sum(pos.value for pos in positions)
-    total_return_value = sum(pos.value * (pos.return_pct / 100.0) for pos in positions)
+    if isinstance(positions, Portfolio):
+        total_value = float(positions.values.sum())
+        weighted_return_pct = 0.0
+        if total_value > 0:
+            weighted_return_pct = float(positions.values @ positions.return_pcts) / total_value
+        return {
+            "total_value": total_value,
+            "weighted_return_pct": weighted_return_pct,
+        }
+
+    # One pass, so one-shot iterators work too; the value-weighted sum stays
+    # in percent and is divided once at the end
+    total_value = 0.0
+    total_return_value = 0.0
+    for pos in positions:
+        total_value += pos.value
+        total_return_value += pos.value * pos.return_pct
     weighted_return_pct = 0.0
     if total_value > 0:
-        weighted_return_pct = (total_return_value / total_value) * 100.0
+        weighted_return_pct = total_return_value / total_value
     return {
         "total_value": total_value,
         "weighted_return_pct": weighted_return_pct,
@@ -149,22 +228,26 @@ def predict_position(
         position: The position to simulate.
         sigma: Annualised volatility used for all assets.
         days: Number of trading days in the forecast horizon.
-        n_sims: Number of Monte Carlo simulations.
+        n_sims: Number of Monte Carlo simulations; 0 uses the closed-form
+            expectation (see analytic_expected_price) instead.
         random_seed: Optional seed for reproducibility.
 
     Returns:
         A dictionary containing the expected price and expected return percentage.
     """
     mu = position.return_pct / 100.0  # convert percent to fraction
-    prices_end = simulate_gbm_price(
-        current_price=position.current_price,
-        mu=mu,
-        sigma=sigma,
-        days=days,
-        n_sims=n_sims,
-        random_seed=random_seed,
-    )
-    expected_price = float(prices_end.mean())
+    if n_sims == 0:
+        expected_price = float(analytic_expected_price(position.current_price, mu, days))
+    else:
+        prices_end = simulate_gbm_price(
+            current_price=position.current_price,
+            mu=mu,
+            sigma=sigma,
+            days=days,
+            n_sims=n_sims,
+            random_seed=random_seed,
+        )
+        expected_price = float(prices_end.mean())
     expected_return_pct = 0.0
     if position.current_price > 0:
         expected_return_pct = (expected_price / position.current_price - 1.0) * 100.0
@@ -175,7 +258,7 @@ def predict_position(
 
 
 def analyse_portfolio(
-    positions: Iterable[Position],
+    positions: Union[Portfolio, Iterable[Position]],
     sigma: float = 0.15,
     days: int = 252,
     n_sims: int = 1000,
@@ -187,45 +270,188 @@ def analyse_portfolio(
     future value and predicted return.  Also includes lists of the top
     performers and laggards based on historical return percentage.
     """
-    positions_list: List[Position] = list(positions)
-    summary = portfolio_summary(positions_list)
-    total_value = summary["total_value"]
+    # All positions are simulated together, in one batched draw
+    (analysis,) = analyse_portfolio_batch(
+        positions, [(sigma, days)], n_sims=n_sims, random_seed=random_seed
+    )
+    return analysis
+
+
+def _expected_prices_batch(
+    prices: np.ndarray,
+    mus: np.ndarray,
+    scenarios: List[Tuple[float, int]],
+    n_sims: int,
+    random_seed: Optional[int],
+) -> List[np.ndarray]:
+    """Monte Carlo expected end prices of several assets under several scenarios.
+
+    A GBM end price only depends on the sum of the path's daily shocks up to
+    the horizon, so those sums are drawn once per asset, horizon by horizon,
+    and shared by every (sigma, days) scenario.  Each asset gets its own
+    shocks, so estimation error is independent across assets, as with one
+    simulate_gbm_price call per asset.  Paths come in antithetic pairs
+    (shocks Z and -Z), which halves the draws and lowers the variance of the
+    estimate at a given n_sims.  n_sims=0 gives the closed-form expectations
+    instead.  Returns one array of expected prices (aligned with prices) per
+    scenario.
+    """
+    if n_sims == 0:
+        return [analytic_expected_price(prices, mus, days) for _, days in scenarios]
+
+    # Sum of each asset's standard normal shocks on each path at every
+    # requested horizon (one row per asset), drawn for half the paths; the
+    # other half mirror them
+    rng = np.random.default_rng(random_seed)
+    n_assets = prices.shape[0]
+    n_drawn = (n_sims + 1) // 2
+    shock_sums: Dict[int, np.ndarray] = {}
+    running = np.zeros((n_assets, n_drawn))
+    draws = np.empty((n_assets, n_drawn))  # reused for every horizon's draws
+    simulated_days = 0
+    for horizon in sorted({days for _, days in scenarios}):
+        # The shocks between two horizons sum to a N(0, days between) draw
+        rng.standard_normal(out=draws)
+        draws *= math.sqrt(horizon - simulated_days)
+        running += draws
+        sums = np.empty((n_assets, n_sims))
+        sums[:, :n_drawn] = running
+        np.negative(running[:, :n_sims - n_drawn], out=sums[:, n_drawn:])
+        shock_sums[horizon] = sums
+        simulated_days = horizon
+
+    expected = []
+    growth = np.empty((n_assets, n_sims))  # scratch for each scenario's path growth
+    for sigma, days in scenarios:
+        # E[P0 * exp(days * drift + sigma * sqrt(dt) * S)] factors into a
+        # drift term and each asset's average over its own paths
+        np.multiply(shock_sums[days], sigma * _SQRT_DT, out=growth)
+        path_growth = np.exp(growth, out=growth).mean(axis=1)
+        expected.append(prices * np.exp(days * (mus - 0.5 * sigma ** 2) * _DT) * path_growth)
+    return expected
+
+
+def _predictions_from_prices(
+    portfolio: Portfolio,
+    expected_prices: np.ndarray,
+) -> Dict[str, Dict[str, float]]:
+    """predict_position-style results keyed by ticker from expected end prices."""
+    priced = portfolio.prices > 0
+    returns_pct = np.zeros_like(expected_prices)
+    returns_pct[priced] = (expected_prices[priced] / portfolio.prices[priced] - 1.0) * 100.0
+    return {
+        ticker: {
+            "expected_price": expected_price,
+            "expected_return_pct": expected_return_pct,
+        }
+        for ticker, expected_price, expected_return_pct in zip(
+            portfolio.tickers.tolist(), expected_prices.tolist(), returns_pct.tolist()
+        )
+    }
 
-    # Determine top and bottom performers by historical returns
-    sorted_by_return = sorted(positions_list, key=lambda p: p.return_pct, reverse=True)
-    top_performers = sorted_by_return[:5]
-    laggards = sorted_by_return[-5:]
 
-    # Predict each position's future price
-    predictions: Dict[str, Dict[str, float]] = {}
-    for pos in positions_list:
-        predictions[pos.ticker] = predict_position(
-            pos, sigma=sigma, days=days, n_sims=n_sims, random_seed=random_seed
-        )
+def predict_positions_batch(
+    positions: Union[Portfolio, Iterable[Position]],
+    sigma: float = 0.15,
+    days: int = 252,
+    n_sims: int = 1000,
+    random_seed: Optional[int] = None,
+) -> Dict[str, Dict[str, float]]:
+    """Estimate the expected future price and return of every position at once.
 
-    # Aggregate predicted portfolio value
-    predicted_portfolio_value = 0.0
-    for pos in positions_list:
-        shares = pos.shares
-        expected_price = predictions[pos.ticker]["expected_price"]
-        predicted_portfolio_value += shares * expected_price
+    Equivalent to calling predict_position for each position, but all
+    positions are simulated in one batched draw.
 
-    predicted_return_pct = 0.0
-    if total_value > 0:
-        predicted_return_pct = (predicted_portfolio_value / total_value - 1.0) * 100.0
+    Args:
+        positions: The positions to simulate, or a Portfolio.
+        sigma: Annualised volatility used for all assets.
+        days: Number of trading days in the forecast horizon.
+        n_sims: Number of Monte Carlo simulations; 0 uses the closed-form
+            expectation instead.
+        random_seed: Optional seed for reproducibility.
 
-    return {
-        "total_value": total_value,
-        "weighted_return_pct": summary["weighted_return_pct"],
-        "predicted_portfolio_value": predicted_portfolio_value,
-        "predicted_portfolio_return_pct": predicted_return_pct,
-        "predictions": predictions,
-        "top_performers": [(p.ticker, p.return_pct) for p in top_performers],
-        "laggards": [(p.ticker, p.return_pct) for p in laggards],
-    }
+    Returns:
+        A dictionary mapping each ticker to its predict_position result.
+    """
+    portfolio = Portfolio.from_positions(positions)
+    (expected_prices,) = _expected_prices_batch(
+        portfolio.prices, portfolio.return_pcts / 100.0,
+        [(float(sigma), int(days))], n_sims, random_seed,
+    )
+
+    return _predictions_from_prices(portfolio, expected_prices)
+
+
+def analyse_portfolio_batch(
+    positions: Union[Portfolio, Iterable[Position]],
+    scenarios: Iterable[Tuple[float, int]],
+    n_sims: int = 1000,
+    random_seed: Optional[int] = None,
+) -> List[Dict[str, object]]:
+    """Analyse a portfolio under several (sigma, days) scenarios at once.
+
+    Equivalent to calling analyse_portfolio once per scenario, but every
+    position is simulated in one batched draw, and every scenario reuses
+    each position's paths (see _expected_prices_batch).
 
+    Args:
+        positions: Iterable of Position objects, or a Portfolio.
+        scenarios: (sigma, days) pairs to evaluate.
+        n_sims: Number of Monte Carlo simulation paths; 0 uses the
+            closed-form expectation instead.
+        random_seed: Optional seed for reproducibility.
+
+    Returns:
+        One analyse_portfolio-style result dictionary per scenario, in order.
+    """
+    portfolio = Portfolio.from_positions(positions)
+    scenarios = [(float(sigma), int(days)) for sigma, days in scenarios]
+    summary = portfolio_summary(portfolio)
+    total_value = summary["total_value"]
+
+    # Highest historical return first; ties keep portfolio order. Only the
+    # five best and five worst are reported, so in larger portfolios only
+    # positions at or beyond the 5th-best/5th-worst return are sorted. All
+    # ties at those cut-offs are kept, so the stable sort picks the same
+    # tickers a full ranking would
+    returns = portfolio.return_pcts
+    if returns.size > 10:
+        fifth_worst, fifth_best = np.partition(returns, (4, returns.size - 5))[[4, -5]]
+        candidates = np.flatnonzero((returns >= fifth_best) | (returns <= fifth_worst))
+    else:
+        candidates = np.arange(returns.size)
+    by_return = candidates[np.argsort(-returns[candidates], kind="stable")]
+    ranked = list(zip(portfolio.tickers[by_return].tolist(), returns[by_return].tolist()))
+    top_performers = ranked[:5]
+    laggards = ranked[-5:]
+
+    shares = portfolio.shares
+    results: List[Dict[str, object]] = []
+    for expected_prices in _expected_prices_batch(
+        portfolio.prices, portfolio.return_pcts / 100.0, scenarios, n_sims, random_seed
+    ):
+        predictions = _predictions_from_prices(portfolio, expected_prices)
+        predicted_portfolio_value = float(shares @ expected_prices)
+
+        predicted_return_pct = 0.0
+        if total_value > 0:
+            predicted_return_pct = (predicted_portfolio_value / total_value - 1.0) * 100.0
+
+        results.append({
+            "total_value": total_value,
+            "weighted_return_pct": summary["weighted_return_pct"],
+            "predicted_portfolio_value": predicted_portfolio_value,
+            "predicted_portfolio_return_pct": predicted_return_pct,
+            "predictions": predictions,
+            "top_performers": top_performers,
+            "laggards": laggards,
+        })
+    return results
 
-def compute_mu_from_today_return(today_return_pct: float) -> float:
+
+def compute_mu_from_today_return(
+    today_return_pct: Union[float, np.ndarray],
+) -> Union[float, np.ndarray]:
     """Convert a one‑day return percentage into an annualised drift estimate.
 
     Because the watchlist only includes a single day's return, this function uses
@@ -236,16 +462,19 @@ def compute_mu_from_today_return(today_return_pct: float) -> float:
     moderate negative drift.
 
     Args:
-        today_return_pct: Percentage change on the most recent trading day.
+        today_return_pct: Percentage change on the most recent trading day,
+            or a NumPy array of them.
 
     Returns:
-        A bounded annualised drift parameter µ for GBM.
+        A bounded annualised drift parameter µ for GBM (one per element for
+        array input).
     """
-    # Convert percentage to fraction and apply scaling
-    mu_estimate = (today_return_pct / 100.0) * 2.0
-    # Bound between -0.05 and +0.20
-    mu_estimate = max(min(mu_estimate, 0.20), -0.05)
-    return mu_estimate
+    # Convert percentage to fraction and apply scaling (/ 100 * 2), then
+    # bound between -0.05 and +0.20
+    mu = np.clip(np.multiply(today_return_pct, 0.02), -0.05, 0.20)
+    if np.ndim(today_return_pct) == 0:
+        return float(mu)
+    return mu
 
 
 def analyse_watchlist(
@@ -261,25 +490,25 @@ def analyse_watchlist(
         watchlist: Iterable of WatchItem objects.
         sigma: Annualised volatility assumed for all items.
         days: Number of trading days to simulate.
-        n_sims: Number of simulation paths per item.
+        n_sims: Number of simulation paths per item; 0 uses the closed-form
+            expectation instead.
         random_seed: Optional seed for reproducibility.
 
     Returns:
         A list of tuples (ticker, expected_return_pct, expected_price) sorted
         by expected_return_pct in descending order.
     """
+    items: List[WatchItem] = list(watchlist)
+    today_returns = np.array([item.today_return_pct for item in items], dtype=np.float64)
+    mus = compute_mu_from_today_return(today_returns)
+    prices = np.array([item.current_price for item in items])
+    # Every item is simulated together, in one batched draw
+    (expected_prices,) = _expected_prices_batch(
+        prices, mus, [(float(sigma), int(days))], n_sims, random_seed
+    )
+
     results: List[Tuple[str, float, float]] = []
-    for item in watchlist:
-        mu = compute_mu_from_today_return(item.today_return_pct)
-        prices_end = simulate_gbm_price(
-            current_price=item.current_price,
-            mu=mu,
-            sigma=sigma,
-            days=days,
-            n_sims=n_sims,
-            random_seed=random_seed,
-        )
-        expected_price = float(prices_end.mean())
+    for item, expected_price in zip(items, expected_prices.tolist()):
         expected_return_pct = 0.0
         if item.current_price > 0:
             expected_return_pct = (expected_price / item.current_price - 1.0) * 100.0
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Tests for the portfolio analysis functions in main.py."""
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from main import Position, analyse_portfolio
+
+
+class TestPerformerRanking(unittest.TestCase):
+    """Test the top performers and laggards reported by analyse_portfolio."""
+
+    def test_tied_returns_match_full_ranking(self):
+        """Ties at the top/bottom cut-offs keep portfolio order, as a full stable sort does."""
+        rng = random.Random(0)
+        for _ in range(300):
+            positions = [
+                Position(f"T{i}", 100.0, float(rng.choice([0, 1, 2, 3])), 10.0)
+                for i in range(rng.randint(11, 60))
+            ]
+            ranked = [
+                (pos.ticker, pos.return_pct)
+                for pos in sorted(positions, key=lambda p: p.return_pct, reverse=True)
+            ]
+
+            analysis = analyse_portfolio(positions, n_sims=0)
+
+            self.assertEqual(analysis["top_performers"], ranked[:5])
+            self.assertEqual(analysis["laggards"], ranked[-5:])
+
+    def test_small_portfolio(self):
+        """Portfolios of ten or fewer positions are ranked in full."""
+        positions = [
+            Position("A", 100.0, 5.0, 10.0),
+            Position("B", 100.0, 7.0, 10.0),
+            Position("C", 100.0, 5.0, 10.0),
+        ]
+
+        analysis = analyse_portfolio(positions, n_sims=0)
+
+        expected = [("B", 7.0), ("A", 5.0), ("C", 5.0)]
+        self.assertEqual(analysis["top_performers"], expected)
+        self.assertEqual(analysis["laggards"], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
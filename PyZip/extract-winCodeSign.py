@@ -167,49 +167,70 @@ def extract_archive(archive_path, extract_to):
     fix_symlinks(extract_to)
     print("✅ Extraction and symlink fixing complete!")
 
+def link_or_copy(src, dst):
+    """Hard-link dst to src, or copy it where a link isn't possible (e.g. across filesystems)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+def iter_symlinks(directory):
+    """Yield the path of every symlink under directory, without following them.
+
+    os.scandir entries carry their file type from the directory listing, so
+    picking out the symlinks needs no extra stat call per file.
+    """
+    try:
+        with os.scandir(directory) as it:
+            # List first so callers can replace entries while we recurse
+            entries = list(it)
+    except OSError:
+        # Skip directories we can't read
+        return
+    for entry in entries:
+        if entry.is_symlink():
+            yield Path(entry.path)
+        elif entry.is_dir(follow_symlinks=False):
+            yield from iter_symlinks(entry.path)
+
 def fix_symlinks(directory):
-    """Replace symlinks with file copies."""
+    """Replace symlinks with hard links to their targets (copies as a fallback)."""
     directory = Path(directory)
     fixed_count = 0
     
-    for root, dirs, files in os.walk(directory):
-        root_path = Path(root)
-        
-        for item in list(dirs) + files:
-            item_path = root_path / item
+    for item_path in iter_symlinks(directory):
+        try:
+            target = item_path.readlink()
+            target_path = item_path.parent / target
+            
+            # Resolve relative symlinks
+            if not target_path.is_absolute():
+                target_path = (item_path.parent / target).resolve()
             
-            try:
-                # Check if it's a symlink
-                if item_path.is_symlink():
-                    target = item_path.readlink()
-                    target_path = item_path.parent / target
-                    
-                    # Resolve relative symlinks
-                    if not target_path.is_absolute():
-                        target_path = (item_path.parent / target).resolve()
-                    
-                    # Remove symlink
-                    item_path.unlink()
-                    
-                    # Copy target if it exists
-                    if target_path.exists():
-                        if target_path.is_file():
-                            shutil.copy2(target_path, item_path)
-                        elif target_path.is_dir():
-                            shutil.copytree(target_path, item_path, dirs_exist_ok=True)
-                        fixed_count += 1
-                        print(f"  Fixed: {item_path.relative_to(directory)}")
-                    else:
-                        # Create placeholder if target doesn't exist
-                        if item_path.suffix:
-                            item_path.touch()
-                        else:
-                            item_path.mkdir(exist_ok=True)
-                        print(f"  Warning: Target not found for {item_path.relative_to(directory)}, created placeholder")
-                        
-            except (OSError, PermissionError) as e:
-                # Skip files we can't process
-                pass
+            # Remove symlink
+            item_path.unlink()
+            
+            # Link (or copy) target if it exists; directories are
+            # walked once, linking each file
+            if target_path.exists():
+                if target_path.is_file():
+                    link_or_copy(target_path, item_path)
+                elif target_path.is_dir():
+                    shutil.copytree(target_path, item_path, copy_function=link_or_copy, dirs_exist_ok=True)
+                fixed_count += 1
+                print(f"  Fixed: {item_path.relative_to(directory)}")
+            else:
+                # Create placeholder if target doesn't exist
+                if item_path.suffix:
+                    item_path.touch()
+                else:
+                    item_path.mkdir(exist_ok=True)
+                print(f"  Warning: Target not found for {item_path.relative_to(directory)}, created placeholder")
+                
+        except (OSError, PermissionError) as e:
+            # Skip files we can't process
+            pass
     
     if fixed_count > 0:
         print(f"Fixed {fixed_count} symlinks.")